@@ -1,16 +1,31 @@
 # scripts/extract_winner_to_draft.py
-import json
 from pathlib import Path
 import sys
 import re
 
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.common import jsonio
+
+SLUG_RE = re.compile(r"[^a-z0-9]+")
+
 def slugify(text: str) -> str:
     text = text.lower()
-    text = re.sub(r"[^a-z0-9]+", "-", text).strip("-")
+    text = SLUG_RE.sub("-", text).strip("-")
     return text
 
+def load_run(src: str) -> dict:
+    # Runs are no longer written as per-run files; a numeric argument is an `llm_runs` id.
+    if src.isdigit() and not Path(src).exists():
+        from src.llm_compare.storage import load_run as load_stored_run
+
+        return load_stored_run(int(src))
+    return jsonio.loads(Path(src).read_bytes())
+
 def main(src_path: str, out_path: str = None):
-    data = json.loads(Path(src_path).read_text(encoding="utf-8"))
+    data = load_run(src_path)
 
     brief = data["brief"]
     winner = data["winner"]
@@ -37,12 +52,12 @@ def main(src_path: str, out_path: str = None):
         out_path = f"data/optimized/{slug}.json"
 
     Path(out_path).parent.mkdir(parents=True, exist_ok=True)
-    Path(out_path).write_text(json.dumps(draft, indent=2, ensure_ascii=False), encoding="utf-8")
+    Path(out_path).write_bytes(jsonio.dumps_bytes(draft))
     print(f"[OK] wrote draft → {out_path}")
 
 if __name__ == "__main__":
     if len(sys.argv) < 2:
-        print("Usage: python scripts/extract_winner_to_draft.py <llm_run.json> [out.json]")
+        print("Usage: python scripts/extract_winner_to_draft.py <llm_runs id | llm_run.json> [out.json]")
         sys.exit(1)
     src = sys.argv[1]
     dst = sys.argv[2] if len(sys.argv) > 2 else None
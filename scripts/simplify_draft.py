@@ -1,15 +1,25 @@
 # scripts/simplify_draft.py
-import json
 from pathlib import Path
 import textwrap
 import sys
 import re
 
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.common import jsonio
+
+SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+
 def split_paragraphs(text: str):
     paras = [p.strip() for p in text.split("\n") if p.strip()]
     return paras
 
 def shorten_sentence(sent: str, limit=22):
+    # Fast path: when the only whitespace is plain spaces, spaces + 1 bounds the word count.
+    if sent.count(" ") < limit and sent.isprintable():
+        return sent
     words = sent.split()
     if len(words) <= limit:
         return sent
@@ -20,13 +30,13 @@ def simplify_content(content: str) -> str:
     new_paras = []
     for p in paras:
         # split on . ! ?
-        parts = re.split(r'(?<=[.!?])\s+', p)
+        parts = SENTENCE_SPLIT_RE.split(p)
         short_parts = [shorten_sentence(s.strip()) for s in parts if s.strip()]
         new_paras.append(" ".join(short_parts))
     return "\n\n".join(new_paras)
 
 def main(src, dst=None):
-    data = json.loads(Path(src).read_text(encoding="utf-8"))
+    data = jsonio.loads(Path(src).read_bytes())
     content = data.get("content", "")
     brief = data.get("brief", "")
 
@@ -41,7 +51,7 @@ def main(src, dst=None):
     if dst is None:
         dst = src.replace(".json", ".simplified.json")
 
-    Path(dst).write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+    Path(dst).write_bytes(jsonio.dumps_bytes(data))
     print(f"[OK] wrote simplified draft → {dst}")
 
 if __name__ == "__main__":
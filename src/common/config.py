@@ -1,35 +1,71 @@
 # Loading environment variables needs to respect the project root, not the package directory.
+from dataclasses import dataclass
+from functools import cache
 from dotenv import load_dotenv, find_dotenv
 import os
 
-dotenv_path = find_dotenv(usecwd=True)
-if dotenv_path:
-    load_dotenv(dotenv_path=dotenv_path)
-else:
-    load_dotenv()
 
+@cache
+def _load_dotenv_once() -> None:
+    # find_dotenv walks parent directories, so only pay for it once per process.
+    dotenv_path = find_dotenv(usecwd=True)
+    if dotenv_path:
+        load_dotenv(dotenv_path=dotenv_path)
+    else:
+        load_dotenv()
+
+
+@dataclass(frozen=True)
 class Settings:
     # WordPress.com
-    WP_DOTCOM_SITE: str = os.getenv("WP_DOTCOM_SITE", "")
-    WP_DOTCOM_API_BASE: str = os.getenv("WP_DOTCOM_API_BASE", "")
-    WP_DOTCOM_BEARER: str = os.getenv("WP_DOTCOM_BEARER", "")  # <— Added this line
+    WP_DOTCOM_SITE: str = ""
+    WP_DOTCOM_API_BASE: str = ""
+    WP_DOTCOM_BEARER: str = ""
 
     # Optional legacy / unused (can stay blank)
-    WP_BASE_URL: str = os.getenv("WP_BASE_URL", "")
-    WP_USERNAME: str = os.getenv("WP_USERNAME", "")
-    WP_APP_PASSWORD_OR_JWT: str = os.getenv("WP_APP_PASSWORD_OR_JWT", "")
+    WP_BASE_URL: str = ""
+    WP_USERNAME: str = ""
+    WP_APP_PASSWORD_OR_JWT: str = ""
 
     # OpenAI
-    OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
+    OPENAI_API_KEY: str = ""
 
     # Model & thresholds
-    MODEL_PRIMARY: str = os.getenv("MODEL_PRIMARY", "gpt-5o")
-    MODEL_SECONDARY: str = os.getenv("MODEL_SECONDARY", "gpt-5o-mini")
-    SEO_THRESHOLD: int = int(os.getenv("SEO_THRESHOLD", "75"))
-    QUALITY_THRESHOLD: int = int(os.getenv("QUALITY_THRESHOLD", "70"))
+    MODEL_PRIMARY: str = "gpt-5o"
+    MODEL_SECONDARY: str = "gpt-5o-mini"
+    SEO_THRESHOLD: int = 75
+    QUALITY_THRESHOLD: int = 70
+
+    # LLM response cache: "exact" reuses stored completions, anything else disables it
+    LLM_CACHE: str = "off"
+    # Route orchestrator comparisons through the OpenAI Batch API (slow, half price)
+    LLM_BATCH_MODE: bool = False
 
     # Prefect
-    PREFECT_API_URL: str = os.getenv("PREFECT_API_URL", "")
-    PREFECT_API_KEY: str = os.getenv("PREFECT_API_KEY", "")
+    PREFECT_API_URL: str = ""
+    PREFECT_API_KEY: str = ""
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        """Snapshot the current environment, falling back to the field defaults."""
+        values = {}
+        for name, field in cls.__dataclass_fields__.items():
+            raw = os.getenv(name)
+            if raw is None:
+                continue
+            if field.type is int:
+                values[name] = int(raw)
+            elif field.type is bool:
+                values[name] = raw.strip().lower() in ("1", "true", "yes", "on")
+            else:
+                values[name] = raw
+        return cls(**values)
+
+
+@cache
+def get_settings() -> Settings:
+    _load_dotenv_once()
+    return Settings.from_env()
+
 
-settings = Settings()
+settings = get_settings()
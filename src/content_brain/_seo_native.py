@@ -0,0 +1,102 @@
+# src/content_brain/_seo_native.py
+"""
+Optional Numba-compiled scanner behind seo_optimizer._scan.
+
+Only ASCII text is handled here: for ASCII the byte rules below match the
+`re` semantics used by the regex path exactly (`\\w` = [A-Za-z0-9_], `\\s`
+= ASCII whitespace). Anything else goes through the regex scanner.
+"""
+try:
+    import numba
+    import numpy as np
+except ImportError:  # numba is optional; seo_optimizer falls back to regex
+    numba = None
+
+AVAILABLE = numba is not None
+
+
+def _is_word(c) -> bool:
+    return (48 <= c <= 57) or (65 <= c <= 90) or (97 <= c <= 122) or c == 95
+
+
+def _is_space(c) -> bool:
+    # str-mode `\s` also matches the \x1c-\x1f separators.
+    return c == 32 or (9 <= c <= 13) or (28 <= c <= 31)
+
+
+def _lower(c):
+    return c + 32 if 65 <= c <= 90 else c
+
+
+def _link_close(buf, i) -> int:
+    """Index of the `)` closing a `(https?://...)` link opened at `i`, else -1."""
+    n = len(buf)
+    j = i + 1
+    if j + 4 > n or buf[j] != 104 or buf[j + 1] != 116 or buf[j + 2] != 116 or buf[j + 3] != 112:
+        return -1
+    j += 4
+    if j < n and buf[j] == 115:  # optional "s"
+        j += 1
+    if j + 3 > n or buf[j] != 58 or buf[j + 1] != 47 or buf[j + 2] != 47:
+        return -1
+    j += 3
+    k = j
+    while k < n and buf[k] != 41:
+        k += 1
+    if k == n or k == j:
+        return -1
+    return k
+
+
+def _scan_ascii(buf, pk):
+    n = len(buf)
+    word_count = 0
+    section_count = 0
+    link_count = 0
+    link_end = -1
+    in_word = False
+    for i in range(n):
+        c = buf[i]
+        is_word = _is_word(c)
+        if is_word and not in_word:
+            word_count += 1
+        in_word = is_word
+        if c == 35:  # "#"
+            if (i == 0 or buf[i - 1] == 10) and i + 2 < n and buf[i + 1] == 35 and _is_space(buf[i + 2]):
+                section_count += 1
+        elif c == 40 and i > link_end:  # "("
+            close = _link_close(buf, i)
+            if close >= 0:
+                link_count += 1
+                link_end = close
+
+    kw_occurrences = 0
+    m = len(pk)
+    if m:
+        i = 0
+        while i <= n - m:
+            k = 0
+            while k < m and _lower(buf[i + k]) == pk[k]:
+                k += 1
+            if k == m:
+                kw_occurrences += 1
+                i += m
+            else:
+                i += 1
+    return word_count, section_count, link_count, kw_occurrences
+
+
+if AVAILABLE:
+    _is_word = numba.njit(cache=True)(_is_word)
+    _is_space = numba.njit(cache=True)(_is_space)
+    _lower = numba.njit(cache=True)(_lower)
+    _link_close = numba.njit(cache=True)(_link_close)
+    _scan_ascii = numba.njit(cache=True)(_scan_ascii)
+
+
+def scan(content: str, pk: str | None) -> tuple[int, int, int, int]:
+    """Native equivalent of seo_optimizer._scan for ASCII `content` and `pk`."""
+    buf = np.frombuffer(content.encode("ascii"), dtype=np.uint8)
+    pk_buf = np.frombuffer((pk or "").encode("ascii"), dtype=np.uint8)
+    word_count, section_count, link_count, kw_occurrences = _scan_ascii(buf, pk_buf)
+    return int(word_count), int(section_count), int(link_count), int(kw_occurrences)
@@ -1,5 +1,8 @@
 # src/content_brain/cli.py
 import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 import typer
 from . import seo_optimizer
@@ -11,6 +14,7 @@ from .generator import (
     load_topics_from_json,
     build_draft,
     save_draft,
+    utc_timestamp,
 )
 
 app = typer.Typer(help="Content Brain – generate structured drafts from topics.")
@@ -37,9 +41,10 @@ def generate_from_file(
         raise typer.Exit(code=1)
 
     count = 0
+    created_at = utc_timestamp()
     for topic in topics:
-        draft = build_draft(topic)
-        out = save_draft(draft)
+        draft = build_draft(topic, created_at=created_at)
+        out = save_draft(draft, indent=False)
         typer.echo(f"✓ Draft saved -> {out}")
         count += 1
         if limit and count >= limit:
@@ -76,10 +81,18 @@ def sample():
     typer.echo(f"✓ Draft saved -> {out}")
     typer.echo(json.dumps(draft, indent=2))
 
+def _optimize_file(path: str, out_dir: str) -> str:
+    """Load, score and save one draft; runs inside a worker process."""
+    draft = seo_optimizer.load_draft(path)
+    draft = seo_optimizer.optimize_draft(draft)
+    return seo_optimizer.save_optimized(draft, out_dir=out_dir, indent=False)
+
+
 @app.command("seo-all")
 def seo_all(
     src_dir: str = typer.Argument("data/drafts", help="Directory of generated drafts"),
     out_dir: str = typer.Argument("data/optimized", help="Where to save optimized drafts"),
+    workers: int = typer.Option(0, help="Worker processes (0=CPU count)"),
 ):
     """Run SEO optimizer on all draft JSON files."""
     src_path = Path(src_dir)
@@ -87,11 +100,15 @@ def seo_all(
         typer.echo(f"❌ Source dir not found: {src_dir}")
         raise typer.Exit(code=1)
 
-    for f in src_path.glob("*.json"):
-        draft = seo_optimizer.load_draft(str(f))
-        draft = seo_optimizer.optimize_draft(draft)
-        out = seo_optimizer.save_optimized(draft, out_dir=out_dir)
-        typer.echo(f"✓ SEO optimized -> {out}")
+    files = [str(f) for f in src_path.glob("*.json")]
+    if not files:
+        return
+
+    # Drafts are independent and CPU-bound (JSON + regex), so fan out across processes.
+    max_workers = min(workers or os.cpu_count() or 1, len(files))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        for out in executor.map(partial(_optimize_file, out_dir=out_dir), files, chunksize=16):
+            typer.echo(f"✓ SEO optimized -> {out}")
 
 if __name__ == "__main__":
     app()
@@ -2,9 +2,12 @@
 Utility helpers for producing scaffolds/outlines before the main LLM run.
 """
 import csv
-import json
+import re
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import lru_cache
+
+from src.common import jsonio
 
 TONES = {
     "practical": {
@@ -25,53 +28,81 @@ TONES = {
     },
 }
 
+SLUG_TABLE = str.maketrans({c: "-" for c in " /_.,:;!?"})
+DASH_RUN_RE = re.compile(r"-{2,}")
+
 def load_topics_from_csv(path: str):
     """
     Parse a CSV file of briefs into a normalized list of topic dicts.
     """
     topics = []
     with open(path, newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return topics
+        columns = {name: idx for idx, name in enumerate(header)}
+        i_title = columns.get("title")
+        i_keywords = columns.get("keywords")
+        i_tone = columns.get("tone")
         for row in reader:
+            if not row:
+                continue
+            keywords = _cell(row, i_keywords, "").split(",")
             topics.append({
-                "title": row.get("title", "").strip(),
-                "keywords": [k.strip() for k in row.get("keywords", "").split(",") if k.strip()],
-                "tone": row.get("tone", "practical").strip(),
+                "title": _cell(row, i_title, "").strip(),
+                "keywords": [k for k in map(str.strip, keywords) if k],
+                "tone": _cell(row, i_tone, "practical").strip(),
             })
     return topics
 
+def _cell(row: list[str], idx: int | None, default: str) -> str:
+    """Positional CSV lookup that tolerates missing columns and short rows."""
+    if idx is None or idx >= len(row):
+        return default
+    return row[idx]
+
 def load_topics_from_json(path: str):
     """
     Lightweight wrapper that keeps JSON topic inputs consistent.
     """
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    return data
+    return jsonio.loads(Path(path).read_bytes())
 
 def make_slug(title: str) -> str:
     """Create a URL-friendly slug with minimal assumptions."""
+    return DASH_RUN_RE.sub("-", title.lower().translate(SLUG_TABLE)).strip("-")
+
+@lru_cache(maxsize=512)
+def _build_outline_cached(title: str, keywords: tuple[str, ...]) -> tuple[tuple[str, str], ...]:
     return (
-        title.lower()
-        .replace(" ", "-")
-        .replace("/", "-")
-        .replace("--", "-")
+        ("Introduction", f"Explain why {title} matters."),
+        ("Key Concepts", "Define core ideas; relate to WordPress + automation if relevant."),
+        ("Step-by-step / Framework", "Actionable steps the reader can follow."),
+        ("SEO / Practical Tips", f"Include keywords: {', '.join(keywords)}"),
+        ("Conclusion / CTA", "Summarize and invite to read more posts."),
     )
 
 def build_outline(title: str, keywords: list[str]):
     """
     Provide a deterministic outline so draft builders know the expected sections.
+
+    Repeated (title, keywords) pairs in batch runs reuse the cached template;
+    callers still get fresh dicts they can mutate.
     """
     return [
-        {"heading": "Introduction", "notes": f"Explain why {title} matters."},
-        {"heading": "Key Concepts", "notes": "Define core ideas; relate to WordPress + automation if relevant."},
-        {"heading": "Step-by-step / Framework", "notes": "Actionable steps the reader can follow."},
-        {"heading": "SEO / Practical Tips", "notes": f"Include keywords: {', '.join(keywords)}"},
-        {"heading": "Conclusion / CTA", "notes": "Summarize and invite to read more posts."},
+        {"heading": heading, "notes": notes}
+        for heading, notes in _build_outline_cached(title, tuple(keywords))
     ]
 
-def build_draft(topic: dict):
+def utc_timestamp() -> str:
+    """Current UTC time as an ISO-8601 string with a `Z` suffix."""
+    return datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
+
+def build_draft(topic: dict, created_at: str | None = None):
     """
     Produce a JSON-ready draft skeleton that downstream stages can enrich.
+
+    Batch callers can pass one `created_at` (see `utc_timestamp`) for every draft.
     """
     title = topic["title"]
     keywords = topic.get("keywords", [])
@@ -110,19 +141,19 @@ def build_draft(topic: dict):
             "primary_keyword": keywords[0] if keywords else "",
             "secondary_keywords": keywords[1:] if len(keywords) > 1 else [],
         },
-        "created_at": datetime.utcnow().isoformat() + "Z",
+        "created_at": created_at or utc_timestamp(),
         "status": "draft-generated",
         "source": "content_brain",
     }
     return draft
 
-def save_draft(draft: dict, out_dir: str = "data/drafts"):
+def save_draft(draft: dict, out_dir: str = "data/drafts", indent: bool = True):
     """
     Persist the generated draft to disk and return the absolute path.
+    Bulk callers pass `indent=False` to write compact JSON.
     """
     Path(out_dir).mkdir(parents=True, exist_ok=True)
     slug = draft["slug"]
     out_path = Path(out_dir) / f"{slug}.json"
-    with open(out_path, "w", encoding="utf-8") as f:
-        json.dump(draft, f, ensure_ascii=False, indent=2)
+    out_path.write_bytes(jsonio.dumps_bytes(draft, indent=indent))
     return str(out_path)
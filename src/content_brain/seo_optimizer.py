@@ -1,25 +1,71 @@
 # src/content_brain/seo_optimizer.py
 import re
 from pathlib import Path
-import json
+
+from src.common import jsonio
+
+# One alternation covers words, `##` headings and markdown links. The link branch only
+# consumes the opening paren (the URL sits in a lookahead) so words inside it still count;
+# `_scan` skips link starts that fall inside the previous link, like a findall would.
+SCAN_RE = re.compile(
+    r"(?P<word>\b\w+\b)|(?P<section>^##\s+)|(?P<link>\((?=https?://[^)]+\)))",
+    re.MULTILINE,
+)
+# Numba-compiled scanner, resolved on the first ASCII scan so importers that never score
+# a draft don't pay numba's import/JIT cost. False once it is known to be unavailable.
+_native_scan = None
 
 def load_draft(path: str) -> dict:
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return jsonio.loads(Path(path).read_bytes())
 
-def save_optimized(draft: dict, out_dir: str = "data/optimized") -> str:
+def save_optimized(draft: dict, out_dir: str = "data/optimized", indent: bool = True) -> str:
     Path(out_dir).mkdir(parents=True, exist_ok=True)
     slug = draft.get("slug", "draft")
     out_path = Path(out_dir) / f"{slug}.json"
-    with open(out_path, "w", encoding="utf-8") as f:
-        json.dump(draft, f, ensure_ascii=False, indent=2)
+    out_path.write_bytes(jsonio.dumps_bytes(draft, indent=indent))
     return str(out_path)
 
+def _scan(content: str, pk: str | None) -> tuple[int, int, int, int]:
+    """Count words, `##` sections, links and primary keyword hits in a single pass."""
+    if content.isascii() and (not pk or pk.isascii()):
+        native_scan = _load_native_scan()
+        if native_scan:
+            return native_scan(content, pk)
+    return _scan_regex(content, pk)
+
+def _load_native_scan():
+    global _native_scan
+    if _native_scan is None:
+        try:
+            from src.content_brain import _seo_native
+        except ImportError:
+            _native_scan = False
+        else:
+            _native_scan = _seo_native.scan if _seo_native.AVAILABLE else False
+    return _native_scan
+
+def _scan_regex(content: str, pk: str | None) -> tuple[int, int, int, int]:
+    word_count = section_count = link_count = 0
+    link_end = 0
+    for m in SCAN_RE.finditer(content):
+        kind = m.lastgroup
+        if kind == "word":
+            word_count += 1
+        elif kind == "section":
+            section_count += 1
+        elif m.start() >= link_end:
+            link_count += 1
+            link_end = content.index(")", m.start())
+    kw_occurrences = content.lower().count(pk) if pk else 0
+    return word_count, section_count, link_count, kw_occurrences
+
 def compute_seo_score(draft: dict) -> tuple[int, dict]:
     title = draft.get("title", "") or ""
     seo = draft.get("seo", {}) or {}
     primary_kw = seo.get("primary_keyword") or (draft.get("keywords") or [None])[0]
     content = draft.get("content", "") or ""
+    # Lowercase the keyword once; _scan lowercases the body at most once (never natively).
+    pk_low = primary_kw.lower() if primary_kw else None
 
     score = 100
     details: dict[str, str | int] = {}
@@ -34,8 +80,7 @@ def compute_seo_score(draft: dict) -> tuple[int, dict]:
 
     # --- Primary keyword in title ---
     if primary_kw:
-        pk = primary_kw.lower()
-        if pk and pk not in title.lower():
+        if pk_low and pk_low not in title.lower():
             score -= 10
             details["primary_kw_in_title"] = "missing"
         else:
@@ -43,8 +88,9 @@ def compute_seo_score(draft: dict) -> tuple[int, dict]:
     else:
         details["primary_kw_in_title"] = "unknown"
 
+    word_count, section_count, link_count, kw_occurrences = _scan(content, pk_low)
+
     # --- Word count ---
-    word_count = len(re.findall(r"\b\w+\b", content))
     if word_count < 600:
         score -= 15
         details["word_count"] = f"low ({word_count})"
@@ -55,8 +101,6 @@ def compute_seo_score(draft: dict) -> tuple[int, dict]:
         details["word_count"] = f"good ({word_count})"
 
     # --- Section count (## headings) ---
-    sections = re.findall(r"^##\s+", content, flags=re.MULTILINE)
-    section_count = len(sections)
     if section_count < 4:
         score -= 12
         details["sections"] = f"too_few ({section_count})"
@@ -68,24 +112,20 @@ def compute_seo_score(draft: dict) -> tuple[int, dict]:
 
     # --- Keyword usage in body ---
     if primary_kw:
-        pk = primary_kw.lower()
-        body_low = content.lower()
-        occurrences = body_low.count(pk)
-        details["primary_kw_in_body"] = occurrences
-        if occurrences < 2:
+        details["primary_kw_in_body"] = kw_occurrences
+        if kw_occurrences < 2:
             score -= 10
-        elif occurrences > 8:
+        elif kw_occurrences > 8:
             score -= 5  # possible keyword stuffing
     else:
         details["primary_kw_in_body"] = "unknown"
 
     # --- Link presence (basic) ---
-    links = re.findall(r"\((https?://[^)]+)\)", content)
-    if not links:
+    if not link_count:
         score -= 8
         details["links"] = "missing"
     else:
-        details["links"] = f"{len(links)}"
+        details["links"] = f"{link_count}"
 
     # --- Image hints / alt text suggestion ---
     details["image_alt_text"] = "Add descriptive alt text to any images with the primary keyword."
@@ -1,11 +1,10 @@
 """
 Streamlit dashboard that surfaces pipeline health, runs, and published posts.
 """
-import json
 import sqlite3
+from contextlib import closing
 from pathlib import Path
 
-import pandas as pd
 import streamlit as st
 
 DB_PATH = Path("data/runs.sqlite")
@@ -17,8 +16,79 @@ ROOT = Path(__file__).resolve().parents[2]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+from src.common import jsonio
 from src.common.config import settings
 
+
+def _connect_ro(db_path: str) -> sqlite3.Connection:
+    return sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+
+
+@st.cache_data(ttl=30)
+def fetch_brief_options(db_path: str) -> list[str]:
+    """Distinct non-empty briefs for the filter dropdown."""
+    with closing(_connect_ro(db_path)) as conn:
+        rows = conn.execute(
+            "SELECT DISTINCT TRIM(brief) AS b FROM llm_runs WHERE b != '' ORDER BY b;"
+        ).fetchall()
+    return [row[0] for row in rows]
+
+
+@st.cache_data(ttl=30)
+def fetch_brief_stats(
+    db_path: str, brief: str | None = None
+) -> tuple[int, float | None, float | None]:
+    """Run count and mean latencies, optionally restricted to one brief."""
+    query = "SELECT COUNT(*), AVG(model_a_latency_ms), AVG(model_b_latency_ms) FROM llm_runs"
+    params: tuple[str, ...] = ()
+    if brief is not None:
+        query += " WHERE TRIM(brief) = ?"
+        params = (brief,)
+    with closing(_connect_ro(db_path)) as conn:
+        return conn.execute(query, params).fetchone()
+
+
+@st.cache_data(ttl=60)
+def collect_final_stats(
+    final_dir: str, dir_mtime: float
+) -> tuple[float | None, float | None, list[tuple[Path, str, object, object]]]:
+    """
+    Scan approved drafts once per directory change.
+
+    `dir_mtime` only keys the cache. Returns the SEO/quality averages plus
+    (path, title, seo, quality) rows for the ten most recently modified drafts.
+    """
+    seo_sum, seo_n, quality_sum, quality_n = 0.0, 0, 0.0, 0
+    parsed = []
+    for p in Path(final_dir).glob("*.json"):
+        try:
+            data = jsonio.loads(p.read_bytes())
+            mtime = p.stat().st_mtime
+        except Exception:
+            continue
+        seo_val = data.get("seo_score")
+        if isinstance(seo_val, (int, float)):
+            seo_sum += seo_val
+            seo_n += 1
+        qm = data.get("quality_meta") or {}
+        qs = qm.get("quality_score") if isinstance(qm, dict) else None
+        if isinstance(qs, (int, float)):
+            quality_sum += qs
+            quality_n += 1
+        parsed.append((mtime, p, data))
+
+    seo_avg = seo_sum / seo_n if seo_n else None
+    quality_avg = quality_sum / quality_n if quality_n else None
+
+    parsed.sort(key=lambda item: item[0], reverse=True)
+    recent = []
+    for _, p, data in parsed[:10]:
+        qm = data.get("quality_meta", {})
+        qs = qm.get("quality_score", "—") if isinstance(qm, dict) else "—"
+        recent.append((p, data.get("title", p.name), data.get("seo_score", "—"), qs))
+    return seo_avg, quality_avg, recent
+
+
 st.set_page_config(
     page_title="AI Content Orchestrator Dashboard",
     layout="wide",
@@ -32,24 +102,11 @@ st.sidebar.success("SQLite OK" if DB_PATH.exists() else "SQLite missing")
 st.sidebar.success("Final dir OK" if FINAL_DIR.exists() else "Final dir missing")
 
 # SLO indicators derived from final drafts
-seo_scores = []
-quality_scores = []
+seo_avg, quality_avg, recent_finals = None, None, []
 if FINAL_DIR.exists():
-    for p in FINAL_DIR.glob("*.json"):
-        try:
-            data = json.loads(p.read_text(encoding="utf-8"))
-        except Exception:
-            continue
-        seo_val = data.get("seo_score")
-        if isinstance(seo_val, (int, float)):
-            seo_scores.append(seo_val)
-        qm = data.get("quality_meta") or {}
-        qs = qm.get("quality_score") if isinstance(qm, dict) else None
-        if isinstance(qs, (int, float)):
-            quality_scores.append(qs)
-
-seo_avg = sum(seo_scores) / len(seo_scores) if seo_scores else None
-quality_avg = sum(quality_scores) / len(quality_scores) if quality_scores else None
+    seo_avg, quality_avg, recent_finals = collect_final_stats(
+        str(FINAL_DIR), FINAL_DIR.stat().st_mtime
+    )
 
 col_a, col_b = st.columns(2)
 seo_ok = seo_avg is not None and seo_avg >= settings.SEO_THRESHOLD
@@ -73,38 +130,46 @@ else:
 
 # --- LLM runs tab ---
 st.subheader("🧠 LLM Comparison Runs")
-llm_df = pd.DataFrame()
+total_stats = None
 if conn is not None:
     try:
-        llm_df = pd.read_sql_query("SELECT * FROM llm_runs ORDER BY id DESC LIMIT 50;", conn)
-    except Exception:
+        total_stats = fetch_brief_stats(str(DB_PATH))
+    except sqlite3.Error:
         st.info("No llm_runs table yet. Trigger an LLM comparison to create it.")
 
-if llm_df.empty:
+if not total_stats or not total_stats[0]:
     st.info("No LLM runs logged yet.")
 else:
-    llm_df = llm_df.copy()
-    llm_df["brief_display"] = (
-        llm_df["brief"]
-        .astype(str)
-        .str.strip()
-        .replace({"nan": ""})
-    )
-    briefs = sorted({b for b in llm_df["brief_display"].tolist() if b})
-    options = ["<all>"] + briefs
+    options = ["<all>"] + fetch_brief_options(str(DB_PATH))
     selected_brief = st.selectbox("Filter by brief", options)
-    filtered_df = llm_df
-    if selected_brief != "<all>":
-        filtered_df = llm_df[llm_df["brief_display"] == selected_brief]
+    query = (
+        "SELECT id, created_at, brief, model_a, model_b, winner, "
+        "model_a_latency_ms, model_b_latency_ms, model_a_cost_usd, model_b_cost_usd "
+        "FROM llm_runs"
+    )
+    if selected_brief == "<all>":
+        run_count, avg_a_latency, avg_b_latency = total_stats
+        rows = conn.execute(query + " ORDER BY id DESC LIMIT 50;").fetchall()
+    else:
+        run_count, avg_a_latency, avg_b_latency = fetch_brief_stats(str(DB_PATH), selected_brief)
+        rows = conn.execute(
+            query + " WHERE TRIM(brief) = ? ORDER BY id DESC LIMIT 50;", (selected_brief,)
+        ).fetchall()
 
-    if filtered_df.empty:
+    if not rows:
         st.info("No runs match the selected brief.")
     else:
-        filtered_df = filtered_df.copy()
-        filtered_df["model_pair"] = filtered_df["model_a"] + " vs " + filtered_df["model_b"]
+        # pandas is only needed to render grids; import it lazily to keep module import cheap.
+        import pandas as pd
+
+        records = [
+            (run_id, created_at, str(brief).strip(), f"{a} vs {b}", winner, lat_a, lat_b, cost_a, cost_b)
+            for run_id, created_at, brief, a, b, winner, lat_a, lat_b, cost_a, cost_b in rows
+        ]
         st.dataframe(
-            filtered_df[
-                [
+            pd.DataFrame.from_records(
+                records,
+                columns=[
                     "id",
                     "created_at",
                     "brief_display",
@@ -114,32 +179,35 @@ else:
                     "model_b_latency_ms",
                     "model_a_cost_usd",
                     "model_b_cost_usd",
-                ]
-            ]
+                ],
+            )
         )
 
         col1, col2, col3, col4 = st.columns(4)
-        col1.metric("Total LLM runs", len(filtered_df))
+        col1.metric("Total LLM runs", run_count)
         col2.metric(
-            "Avg model A latency (ms)", f"{filtered_df['model_a_latency_ms'].mean():.0f}"
+            "Avg model A latency (ms)",
+            f"{avg_a_latency:.0f}" if avg_a_latency is not None else "—",
         )
         col3.metric(
-            "Avg model B latency (ms)", f"{filtered_df['model_b_latency_ms'].mean():.0f}"
+            "Avg model B latency (ms)",
+            f"{avg_b_latency:.0f}" if avg_b_latency is not None else "—",
         )
-        latest = filtered_df.iloc[0]
+        latest_id, latest_created_at, _, _, _, _, latest_a, latest_b, _, _ = rows[0]
         col4.metric(
             "Latest run latency (ms)",
-            f"A: {latest['model_a_latency_ms']} | B: {latest['model_b_latency_ms']}",
-            help=f"Run ID {latest['id']} at {latest['created_at']}",
+            f"A: {latest_a} | B: {latest_b}",
+            help=f"Run ID {latest_id} at {latest_created_at}",
         )
-        filtered_df.rename(columns={"brief_display": "brief"}, inplace=True)
 
 st.markdown("---")
 
 # --- Published posts tab ---
 st.subheader("📰 Published Posts (WordPress.com)")
-published_df = pd.DataFrame()
+published_df = None
 if conn is not None:
+    import pandas as pd
+
     try:
         published_df = pd.read_sql_query(
             "SELECT * FROM published_posts ORDER BY id DESC LIMIT 50;", conn
@@ -147,12 +215,20 @@ if conn is not None:
     except Exception:
         st.info("No published_posts table yet. Publish once to create it.")
 
-if not published_df.empty:
+if published_df is not None and not published_df.empty:
     st.dataframe(
         published_df[["id", "created_at", "title", "wp_link", "slug", "source_file"]]
     )
-    for _, row in published_df.iterrows():
-        st.markdown(f"- [{row['title']}]({row['wp_link']}) ({row['created_at']})")
+    links = (
+        "- ["
+        + published_df["title"].astype(str)
+        + "]("
+        + published_df["wp_link"].astype(str)
+        + ") ("
+        + published_df["created_at"].astype(str)
+        + ")"
+    )
+    st.markdown("\n".join(links))
 else:
     st.write("No published posts logged.")
 
@@ -161,17 +237,7 @@ st.markdown("---")
 # --- Recent finals from data/final ---
 st.subheader("✅ Recently Approved Drafts")
 if FINAL_DIR.exists():
-    files = sorted(
-        FINAL_DIR.glob("*.json"),
-        key=lambda p: p.stat().st_mtime,
-        reverse=True,
-    )
-    for p in files[:10]:
-        data = json.loads(p.read_text(encoding="utf-8"))
-        title = data.get("title", p.name)
-        seo = data.get("seo_score", "—")
-        qm = data.get("quality_meta", {})
-        qs = qm.get("quality_score", "—")
+    for p, title, seo, qs in recent_finals:
         st.markdown(f"**{title}** — SEO: {seo}, Quality: {qs}  \n`{p}`")
 else:
     st.write("No data/final/ directory yet.")
@@ -3,7 +3,6 @@
 Streamlit front end for running the AI Content Orchestrator pipeline.
 """
 
-import json
 import sys
 from pathlib import Path
 
@@ -16,6 +15,7 @@ if str(ROOT) not in sys.path:
 
 from src.orchestrator.tasks import task_generate_from_brief, task_quality_gate, task_publish
 from src.common.config import settings
+from src.common import jsonio
 
 
 def run_pipeline(brief: str, model_a: str, model_b: str, auto_publish: bool, tone: str | None):
@@ -191,7 +191,7 @@ def main():
         else:
             final_path = Path(result["final_path"])
             if final_path.exists():
-                data = json.loads(final_path.read_text(encoding="utf-8"))
+                data = jsonio.loads(final_path.read_bytes())
                 st.json(data)
 
 
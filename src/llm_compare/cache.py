@@ -0,0 +1,76 @@
+# src/llm_compare/cache.py
+"""
+Exact-match response cache for `call_model`, stored in SQLite.
+
+Keyed on sha256(model + prompt) so re-running the same brief/tone/model skips the
+API call. Enabled with `LLM_CACHE=exact`; anything else leaves it off.
+"""
+import hashlib
+import sqlite3
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+CACHE_DB_PATH = Path("data/llm_cache.sqlite")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_cache (
+    key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    prompt TEXT NOT NULL,
+    output TEXT NOT NULL,
+    input_tokens INTEGER,
+    output_tokens INTEGER,
+    created_at TEXT NOT NULL
+);
+"""
+
+
+def cache_key(model: str, prompt: str) -> str:
+    return hashlib.sha256(f"{model}\0{prompt}".encode("utf-8")).hexdigest()
+
+
+def _connect(db_path: Path) -> sqlite3.Connection:
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    conn.execute(SCHEMA)
+    return conn
+
+
+def get(key: str, db_path: Path = CACHE_DB_PATH) -> Optional[tuple[str, int, int]]:
+    """Return `(output, input_tokens, output_tokens)` for a cached key, else None."""
+    if not db_path.exists():
+        return None
+    conn = _connect(db_path)
+    try:
+        row = conn.execute(
+            "SELECT output, input_tokens, output_tokens FROM llm_cache WHERE key = ?",
+            (key,),
+        ).fetchone()
+    finally:
+        conn.close()
+    return row
+
+
+def put(
+    key: str,
+    model: str,
+    prompt: str,
+    output: str,
+    input_tokens: int,
+    output_tokens: int,
+    db_path: Path = CACHE_DB_PATH,
+) -> None:
+    conn = _connect(db_path)
+    try:
+        conn.execute(
+            """
+            INSERT OR REPLACE INTO llm_cache (
+                key, model, prompt, output, input_tokens, output_tokens, created_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            (key, model, prompt, output, input_tokens, output_tokens, datetime.now(timezone.utc).isoformat()),
+        )
+        conn.commit()
+    finally:
+        conn.close()
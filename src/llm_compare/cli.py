@@ -25,7 +25,7 @@ def main():
     save_result(result)
 
     print(f"[OK] Winner: {result.winner}")
-    print(f"Stored run in data/runs.sqlite and JSON in data/runs/")
+    print("Stored run in data/runs.sqlite and appended it to data/runs/runs.jsonl.gz")
     print(f"Model A latency: {result.model_a.latency_ms} ms")
     print(f"Model B latency: {result.model_b.latency_ms} ms")
 
@@ -1,12 +1,19 @@
 # src/llm_compare/evaluator.py
+import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from textwrap import dedent
+from functools import cache
+from itertools import islice
 from typing import Dict, Optional
 
-from openai import OpenAI
+import httpx
+from openai import APIError, OpenAI
 
+from src.common import jsonio
 from src.common.config import settings
+from src.llm_compare import cache as llm_cache
 from src.llm_compare.models import LLMComparisonResult, LLMRunResult
 
 MODEL_COST_PER_1K = {
@@ -19,6 +26,53 @@ TONE_HINTS = {
     "authoritative": "confident, expert voice with decisive recommendations",
     "friendly": "approachable, conversational, encouraging tone",
 }
+CLARITY_MIN_WORDS = 120
+WORD_RE = re.compile(r"\S+")
+OPENAI_MAX_RETRIES = 3
+# After this many consecutive model B failures, comparisons skip B for the cooldown.
+CIRCUIT_BREAKER_THRESHOLD = 5
+CIRCUIT_BREAKER_COOLDOWN_S = 300
+BATCH_COST_FACTOR = 0.5  # Batch API requests are billed at half the live rate
+BATCH_POLL_SECONDS = 30
+BATCH_TERMINAL_STATUSES = ("completed", "failed", "expired", "cancelled")
+
+# Static instructions live in the system message so every comparison shares an identical
+# prefix, which lets OpenAI's automatic prompt caching discount it.
+SYSTEM_PROMPT = """You are generating a WordPress.com-ready blog draft in **Markdown**.
+The downstream formatter will **strip your TOC and rebuild it**, so follow this format exactly.
+
+STRUCTURE RULES (very important):
+1. Start with a "Table of Contents" heading (plain text, no `#`) followed immediately by a bulleted list.
+2. Each bullet must link to a section that appears later, e.g. `- [Introduction](#introduction)`.
+3. Use ONLY these heading levels in the body:
+   - `##` for main sections (H2 logical level)
+   - `###` for sub-sections (H3 logical level)
+   - never output literal strings like `H2:` or `H3:`; always convert them to markdown headings instead.
+4. Order of sections must be: Introduction → 3–4 main sections → Conclusion → FAQs.
+5. In the **FAQs** section:
+   - add a `## FAQs` heading
+   - each question is a bold sentence in a paragraph, e.g. `**Can I use X?**`
+   - the answer is the paragraph right after it
+   - do NOT use headings for individual FAQ questions
+
+HARD VALIDATION RULES (your output will be rejected if you break these):
+- Do NOT output lines that start with `H1:`, `H2:`, or `H3:`.
+- The string "Table of Contents" must come before `## Introduction`.
+- All actual headings must be either `## ...` or `### ...`.
+- `## FAQs` must be the last main section, after `## Conclusion`.
+
+Example start (adapt titles to the topic):
+Table of Contents
+- [Introduction](#introduction)
+- [Key Strategies](#key-strategies)
+- [Conclusion](#conclusion)
+- [FAQs](#faqs)
+
+## Introduction
+...content...
+
+Return ONLY the markdown, no explanation."""
+USER_PROMPT_FOOTER = "Return ONLY the markdown, no explanation."
 
 
 def estimate_cost(model: str, input_tokens: int, output_tokens: int) -> float:
@@ -27,34 +81,81 @@ def estimate_cost(model: str, input_tokens: int, output_tokens: int) -> float:
     return (total_tokens / 1000.0) * rate
 
 
-def call_model(client: OpenAI, model: str, prompt: str) -> LLMRunResult:
-    start = time.time()
-    response = client.chat.completions.create(
+def call_model(client: OpenAI, model: str, messages: list[dict[str, str]]) -> LLMRunResult:
+    """
+    Run one chat completion; `LLMRunResult.prompt` records the final user message.
+
+    With `LLM_CACHE=exact`, identical model+messages pairs are served from the local cache.
+    """
+    start = time.perf_counter_ns()
+    cache_key = None
+    if settings.LLM_CACHE == "exact":
+        full_prompt = "\0".join(f"{m['role']}:{m['content']}" for m in messages)
+        cache_key = llm_cache.cache_key(model, full_prompt)
+        hit = llm_cache.get(cache_key)
+        if hit is not None:
+            output, input_tokens, output_tokens = hit
+            latency_ms = (time.perf_counter_ns() - start) // 1_000_000
+            return LLMRunResult(
+                model=model,
+                prompt=messages[-1]["content"],
+                output=output,
+                latency_ms=latency_ms,
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                # Nothing was billed and no token was streamed for a cache hit.
+                cost_usd=0.0,
+                first_token_ms=None,
+                cached=True,
+            )
+
+    # Stream so the time-to-first-token is observable; include_usage keeps token counts
+    # (they arrive on a final chunk with no choices).
+    stream = client.chat.completions.create(
         model=model,
-        messages=[{"role": "user", "content": prompt}],
+        messages=messages,
+        stream=True,
+        stream_options={"include_usage": True},
     )
-    latency_ms = int((time.time() - start) * 1000)
-    content = response.choices[0].message.content
+    parts: list[str] = []
+    first_token_ms: Optional[int] = None
+    usage = None
+    for chunk in stream:
+        if chunk.choices:
+            delta = chunk.choices[0].delta.content
+            if delta:
+                if first_token_ms is None:
+                    first_token_ms = (time.perf_counter_ns() - start) // 1_000_000
+                parts.append(delta)
+        if getattr(chunk, "usage", None):
+            usage = chunk.usage
+    latency_ms = (time.perf_counter_ns() - start) // 1_000_000
+    content = "".join(parts)
 
-    usage = getattr(response, "usage", None)
     input_tokens = getattr(usage, "prompt_tokens", 0) if usage else 0
     output_tokens = getattr(usage, "completion_tokens", 0) if usage else 0
     cost_usd = estimate_cost(model, input_tokens, output_tokens)
 
+    if cache_key is not None and content:
+        llm_cache.put(cache_key, model, full_prompt, content, input_tokens, output_tokens)
+
     return LLMRunResult(
         model=model,
-        prompt=prompt,
+        prompt=messages[-1]["content"],
         output=content,
         latency_ms=latency_ms,
         input_tokens=input_tokens,
         output_tokens=output_tokens,
         cost_usd=cost_usd,
+        first_token_ms=first_token_ms,
     )
 
 
 def _heuristic_score(text: str) -> Dict[str, float]:
-    length = len(text.split())
-    clarity = 85 if length > 120 else 70
+    # Only "more than CLARITY_MIN_WORDS" matters, so stop counting once that is settled
+    # instead of splitting the whole draft into a list.
+    length = sum(1 for _ in islice(WORD_RE.finditer(text), CLARITY_MIN_WORDS + 1))
+    clarity = 85 if length > CLARITY_MIN_WORDS else 70
     coverage = 85 if "##" in text else 60
     return {
         "clarity": clarity,
@@ -76,71 +177,125 @@ def _tone_instruction(tone: Optional[str]) -> str:
     return f"Adopt a {tone.strip()} tone that fits modern WordPress.com editorial."
 
 
-def compare_models(
-    brief: str,
-    model_a: str,
-    model_b: str,
-    tone: Optional[str] = None,
-) -> LLMComparisonResult:
-    api_key = settings.OPENAI_API_KEY
-    if not api_key:
+def _build_messages(brief: str, tone: Optional[str]) -> list[dict[str, str]]:
+    tone_line = _tone_instruction(tone)
+    # SYSTEM_PROMPT is built once at import; only this short tail varies per comparison.
+    user_message = f"Topic/brief: {brief}\nTone guidance: {tone_line}\n{USER_PROMPT_FOOTER}"
+    return [
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {"role": "user", "content": user_message},
+    ]
+
+
+@cache
+def get_openai_client() -> OpenAI:
+    """
+    Process-wide OpenAI client, so the underlying HTTP connection pool (and its
+    keep-alive sockets) is shared by every comparison and revision.
+    """
+    # Fail fast on connect; keep the SDK's long read timeout for full-draft completions.
+    # The SDK retries 408/409/429/5xx, connection errors and timeouts with jittered
+    # exponential backoff; OPENAI_MAX_RETRIES retries means up to four attempts per call.
+    return OpenAI(
+        api_key=settings.OPENAI_API_KEY,
+        max_retries=OPENAI_MAX_RETRIES,
+        timeout=httpx.Timeout(600.0, connect=5.0),
+    )
+
+
+def _client() -> OpenAI:
+    if not settings.OPENAI_API_KEY:
         raise RuntimeError("OPENAI_API_KEY is missing; set it before running comparisons.")
+    return get_openai_client()
 
-    client = OpenAI(api_key=api_key)
 
-    tone_line = _tone_instruction(tone)
+class _CircuitBreaker:
+    """Consecutive-failure breaker guarding the secondary model; thread-safe."""
 
-    prompt = dedent(
-        f"""You are generating a WordPress.com-ready blog draft in **Markdown**.
-The downstream formatter will **strip your TOC and rebuild it**, so follow this format exactly.
-Topic/brief: {brief}
-Tone guidance: {tone_line}
+    def __init__(self, threshold: int, cooldown_s: float) -> None:
+        self.threshold = threshold
+        self.cooldown_s = cooldown_s
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._probing = False  # a half-open trial call is in flight
+        self._lock = threading.Lock()
 
-STRUCTURE RULES (very important):
-1. Start with a "Table of Contents" heading (plain text, no `#`) followed immediately by a bulleted list.
-2. Each bullet must link to a section that appears later, e.g. `- [Introduction](#introduction)`.
-3. Use ONLY these heading levels in the body:
-   - `##` for main sections (H2 logical level)
-   - `###` for sub-sections (H3 logical level)
-   - never output literal strings like `H2:` or `H3:`; always convert them to markdown headings instead.
-4. Order of sections must be: Introduction → 3–4 main sections → Conclusion → FAQs.
-5. In the **FAQs** section:
-   - add a `## FAQs` heading
-   - each question is a bold sentence in a paragraph, e.g. `**Can I use X?**`
-   - the answer is the paragraph right after it
-   - do NOT use headings for individual FAQ questions
+    def allow(self) -> bool:
+        with self._lock:
+            if self._probing:
+                return False
+            if self._opened_at is None:
+                return True
+            if time.monotonic() - self._opened_at >= self.cooldown_s:
+                # Half-open: exactly one caller gets the trial; its result closes or
+                # re-opens the breaker, and everyone else is refused until then.
+                self._probing = True
+                return True
+            return False
 
-HARD VALIDATION RULES (your output will be rejected if you break these):
-- Do NOT output lines that start with `H1:`, `H2:`, or `H3:`.
-- The string "Table of Contents" must come before `## Introduction`.
-- All actual headings must be either `## ...` or `### ...`.
-- `## FAQs` must be the last main section, after `## Conclusion`.
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
 
-Example start (adapt titles to the topic):
-Table of Contents
-- [Introduction](#introduction)
-- [Key Strategies](#key-strategies)
-- [Conclusion](#conclusion)
-- [FAQs](#faqs)
+    def record_failure(self) -> None:
+        with self._lock:
+            if self._probing:
+                self._probing = False
+                self._opened_at = time.monotonic()
+                return
+            self._failures += 1
+            if self._failures >= self.threshold:
+                self._opened_at = time.monotonic()
 
-## Introduction
-...content...
 
-Return ONLY the markdown, no explanation."""
+_model_b_breaker = _CircuitBreaker(CIRCUIT_BREAKER_THRESHOLD, CIRCUIT_BREAKER_COOLDOWN_S)
+
+
+def _skipped_run(model: str, messages: list[dict[str, str]]) -> LLMRunResult:
+    return LLMRunResult(
+        model=model,
+        prompt=messages[-1]["content"],
+        output="",
+        latency_ms=0,
+        input_tokens=0,
+        output_tokens=0,
+        cost_usd=0.0,
     )
 
-    run_a = call_model(client, model_a, prompt)
-    run_b = call_model(client, model_b, prompt)
 
+def _build_comparison(
+    brief: str,
+    model_a: str,
+    model_b: str,
+    run_a: LLMRunResult,
+    run_b: LLMRunResult,
+    model_b_error: Optional[str] = None,
+) -> LLMComparisonResult:
     scores_a = _heuristic_score(run_a.output)
     scores_b = _heuristic_score(run_b.output)
-    avg_a = sum(scores_a.values()) / len(scores_a)
-    avg_b = sum(scores_b.values()) / len(scores_b)
 
-    winner = model_a if avg_a >= avg_b else model_b
+    # Prefix the keys and total the values in the same walk over each score dict.
+    scores: Dict[str, float] = {}
+    total_a = total_b = 0
+    for key, value in scores_a.items():
+        scores[f"model_a_{key}"] = value
+        total_a += value
+    for key, value in scores_b.items():
+        scores[f"model_b_{key}"] = value
+        total_b += value
+    avg_a = total_a / len(scores_a)
+    avg_b = total_b / len(scores_b)
 
-    scores = {f"model_a_{key}": value for key, value in scores_a.items()}
-    scores.update({f"model_b_{key}": value for key, value in scores_b.items()})
+    winner = model_a if avg_a >= avg_b or model_b_error else model_b
+
+    extra = {"avg_a": avg_a, "avg_b": avg_b}
+    if model_b_error:
+        extra["model_b_error"] = model_b_error
+    cached = [run.model for run in (run_a, run_b) if run.cached]
+    if cached:
+        extra["cached"] = cached
 
     return LLMComparisonResult(
         brief=brief,
@@ -149,5 +304,147 @@ Return ONLY the markdown, no explanation."""
         scores=scores,
         winner=winner,
         created_at=datetime.utcnow().isoformat(),
-        extra={"avg_a": avg_a, "avg_b": avg_b},
+        extra=extra,
     )
+
+
+def compare_models(
+    brief: str,
+    model_a: str,
+    model_b: str,
+    tone: Optional[str] = None,
+    client: Optional[OpenAI] = None,
+) -> LLMComparisonResult:
+    client = client or _client()
+    messages = _build_messages(brief, tone)
+
+    # The two completions are independent network calls; overlap them so wall time is max(a, b).
+    # Model A's output is required; if B keeps failing, fall back to A alone.
+    model_b_error = None
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        future_a = pool.submit(call_model, client, model_a, messages)
+        future_b = pool.submit(call_model, client, model_b, messages) if _model_b_breaker.allow() else None
+        # Settle B (and the breaker) before A's result can raise.
+        if future_b is None:
+            model_b_error = "skipped: circuit breaker open"
+        else:
+            try:
+                run_b = future_b.result()
+                _model_b_breaker.record_success()
+            except APIError as exc:
+                _model_b_breaker.record_failure()
+                model_b_error = f"{type(exc).__name__}: {exc}"
+            except BaseException:
+                # Still settle the breaker so a half-open trial can't leave it stuck.
+                _model_b_breaker.record_failure()
+                raise
+        run_a = future_a.result()
+
+    if model_b_error:
+        run_b = _skipped_run(model_b, messages)
+    return _build_comparison(brief, model_a, model_b, run_a, run_b, model_b_error)
+
+
+def compare_models_batched(
+    briefs: list[tuple[str, Optional[str]]],
+    model_a: str,
+    model_b: str,
+) -> list[LLMComparisonResult]:
+    """
+    Run `(brief, tone)` comparisons through the OpenAI Batch API.
+
+    Every request (two per brief) goes into one JSONL upload; this blocks until the
+    batch finishes, so it suits offline/nightly runs. Batch pricing is half the live
+    rate, and `latency_ms` is the batch turnaround since per-request timings aren't reported.
+    """
+    client = _client()
+    start = time.perf_counter_ns()
+
+    prompts: dict[str, tuple[str, str]] = {}
+    lines = []
+    for i, (brief, tone) in enumerate(briefs):
+        messages = _build_messages(brief, tone)
+        for suffix, model in (("a", model_a), ("b", model_b)):
+            custom_id = f"{i}-{suffix}"
+            prompts[custom_id] = (model, messages[-1]["content"])
+            lines.append(
+                jsonio.dumps_bytes(
+                    {
+                        "custom_id": custom_id,
+                        "method": "POST",
+                        "url": "/v1/chat/completions",
+                        "body": {"model": model, "messages": messages},
+                    },
+                    indent=False,
+                )
+            )
+
+    batch_file = client.files.create(file=("llm_compare_batch.jsonl", b"\n".join(lines)), purpose="batch")
+    batch = client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+    )
+    while batch.status not in BATCH_TERMINAL_STATUSES:
+        time.sleep(BATCH_POLL_SECONDS)
+        batch = client.batches.retrieve(batch.id)
+    if batch.status == "failed":
+        # The whole batch was rejected (e.g. input validation); nothing ran.
+        raise RuntimeError(f"OpenAI batch {batch.id} failed: {getattr(batch, 'errors', None)}")
+    # "expired"/"cancelled" batches may still carry partial output; whatever is missing
+    # below is re-run live, as are requests that failed individually.
+    latency_ms = (time.perf_counter_ns() - start) // 1_000_000
+
+    runs: dict[str, LLMRunResult] = {}
+    failures: dict[str, str] = {}
+    for row in _batch_file_rows(client, batch.output_file_id):
+        custom_id = row["custom_id"]
+        response = row.get("response") or {}
+        if row.get("error") or response.get("status_code") != 200:
+            failures[custom_id] = str(row.get("error") or response)
+            continue
+        body = response["body"]
+        usage = body.get("usage") or {}
+        input_tokens = usage.get("prompt_tokens", 0)
+        output_tokens = usage.get("completion_tokens", 0)
+        model, prompt = prompts[custom_id]
+        runs[custom_id] = LLMRunResult(
+            model=model,
+            prompt=prompt,
+            output=body["choices"][0]["message"]["content"] or "",
+            latency_ms=latency_ms,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            cost_usd=estimate_cost(model, input_tokens, output_tokens) * BATCH_COST_FACTOR,
+        )
+    # Failed requests are reported only in the error file, not the output file.
+    for row in _batch_file_rows(client, getattr(batch, "error_file_id", None)):
+        response = row.get("response") or {}
+        failures[row["custom_id"]] = str(row.get("error") or response.get("body") or response)
+
+    results = []
+    for i, (brief, tone) in enumerate(briefs):
+        run_a, run_b = runs.get(f"{i}-a"), runs.get(f"{i}-b")
+        if run_a is None or run_b is None:
+            for custom_id in (f"{i}-a", f"{i}-b"):
+                if custom_id not in runs:
+                    reason = failures.get(custom_id, f"no result (batch {batch.status})")
+                    print(
+                        f"[llm_compare] Batch request for {prompts[custom_id][0]} on brief "
+                        f"{brief!r} failed: {reason}; re-running live."
+                    )
+            results.append(compare_models(brief, model_a, model_b, tone, client=client))
+            continue
+        results.append(_build_comparison(brief, model_a, model_b, run_a, run_b))
+    return results
+
+
+def _batch_file_rows(client: OpenAI, file_id: Optional[str]) -> list[dict]:
+    """Parsed JSONL rows of a batch output/error file; empty when there is no file."""
+    if not file_id:
+        return []
+    return [
+        jsonio.loads(line)
+        for line in client.files.content(file_id).text.splitlines()
+        if line.strip()
+    ]
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from typing import Optional, Dict, Any
 import time
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LLMRunResult:
     model: str
     prompt: str
@@ -12,8 +12,10 @@ class LLMRunResult:
     input_tokens: int
     output_tokens: int
     cost_usd: float
+    first_token_ms: Optional[int] = None  # None when the stream yielded no content
+    cached: bool = False  # served from the LLM_CACHE=exact cache; no API call was made
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LLMComparisonResult:
     brief: str
     model_a: LLMRunResult
@@ -1,14 +1,18 @@
 # src/llm_compare/storage.py
 import os
-import json
+import gzip
 import sqlite3
-from typing import Any
+import threading
+from dataclasses import asdict
+from typing import Any, Optional
 from pathlib import Path
 
-from src.llm_compare.models import LLMComparisonResult
+from src.common import jsonio
+from src.llm_compare.models import LLMComparisonResult, LLMRunResult
 
 DB_PATH = Path("data/runs.sqlite")
 RUNS_DIR = Path("data/runs")
+RUNS_STREAM = RUNS_DIR / "runs.jsonl.gz"
 
 SCHEMA = """
 CREATE TABLE IF NOT EXISTS llm_runs (
@@ -28,52 +32,103 @@ CREATE TABLE IF NOT EXISTS llm_runs (
 );
 """
 
+_conn: Optional[sqlite3.Connection] = None
+_conn_lock = threading.Lock()
+_stream_lock = threading.Lock()
+
+def _get_conn() -> sqlite3.Connection:
+    """
+    Process-wide connection, opened on first use. WAL + synchronous=NORMAL avoids a
+    full fsync per commit; callers must hold `_conn_lock` while using it.
+    """
+    global _conn
+    if _conn is None:
+        DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(SCHEMA)
+        conn.commit()
+        _conn = conn
+    return _conn
+
 def init_db():
-    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(DB_PATH)
-    conn.execute(SCHEMA)
-    conn.commit()
-    conn.close()
+    with _conn_lock:
+        _get_conn()
+
+INSERT_SQL = """
+INSERT INTO llm_runs (
+    created_at, brief, model_a, model_b, winner,
+    model_a_latency_ms, model_b_latency_ms,
+    model_a_cost_usd, model_b_cost_usd,
+    model_a_avg_score, model_b_avg_score,
+    raw_json
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
 
 def save_result(result: LLMComparisonResult):
-    init_db()
+    save_results([result])
+
+def save_results(results: list[LLMComparisonResult]):
+    """
+    Persist runs as lines in the gzipped `RUNS_STREAM` plus one `llm_runs` row each,
+    inserting all rows in a single transaction. The stream is only appended once that
+    transaction has committed, so a failed insert never leaves orphan lines behind.
+    """
+    if not results:
+        return
+
+    # Serialize each run once; the same compact blob feeds the stream and `raw_json`.
+    blobs = [jsonio.dumps_bytes(_to_jsonable(result), indent=False) for result in results]
+    rows = [_row(result, blob.decode("utf-8")) for result, blob in zip(results, blobs)]
+    with _conn_lock, _get_conn() as conn:
+        conn.executemany(INSERT_SQL, rows)
+    _append_to_stream(blobs)
+
+def load_run(run_id: int) -> dict[str, Any]:
+    """Stored JSON of the `llm_runs` row `run_id` (the same document as its stream line)."""
+    with _conn_lock:
+        row = _get_conn().execute("SELECT raw_json FROM llm_runs WHERE id = ?", (run_id,)).fetchone()
+    if row is None:
+        raise KeyError(f"No llm_runs row with id {run_id}")
+    return jsonio.loads(row[0])
+
+def _append_to_stream(blobs: list[bytes]):
+    # Each call appends one complete gzip member; readers see the members as one stream.
     RUNS_DIR.mkdir(parents=True, exist_ok=True)
+    with _stream_lock, gzip.open(RUNS_STREAM, "ab") as f:
+        f.write(b"".join(blob + b"\n" for blob in blobs))
 
-    # save json artifact
-    fname = RUNS_DIR / f"llm_run_{result.created_at.replace(':','-')}.json"
-    with open(fname, "w", encoding="utf-8") as f:
-        json.dump(_to_jsonable(result), f, indent=2, ensure_ascii=False)
-
-    # save to sqlite
-    import sqlite3
-    conn = sqlite3.connect(DB_PATH)
-    conn.execute(
-        """
-        INSERT INTO llm_runs (
-            created_at, brief, model_a, model_b, winner,
-            model_a_latency_ms, model_b_latency_ms,
-            model_a_cost_usd, model_b_cost_usd,
-            model_a_avg_score, model_b_avg_score,
-            raw_json
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-        (
-            result.created_at,
-            result.brief,
-            result.model_a.model,
-            result.model_b.model,
-            result.winner,
-            result.model_a.latency_ms,
-            result.model_b.latency_ms,
-            result.model_a.cost_usd,
-            result.model_b.cost_usd,
-            result.extra.get("avg_a"),
-            result.extra.get("avg_b"),
-            json.dumps(_to_jsonable(result)),
-        ),
+def migrate_legacy_runs() -> int:
+    """
+    Fold legacy per-run `llm_run_*.json` artifacts into `RUNS_STREAM` and delete them.
+    Returns the number of runs migrated.
+    """
+    legacy = sorted(RUNS_DIR.glob("llm_run_*.json"))
+    if not legacy:
+        return 0
+    _append_to_stream(
+        [jsonio.dumps_bytes(jsonio.loads(path.read_bytes()), indent=False) for path in legacy]
+    )
+    for path in legacy:
+        path.unlink()
+    return len(legacy)
+
+def _row(result: LLMComparisonResult, raw_json: str) -> tuple:
+    return (
+        result.created_at,
+        result.brief,
+        result.model_a.model,
+        result.model_b.model,
+        result.winner,
+        result.model_a.latency_ms,
+        result.model_b.latency_ms,
+        result.model_a.cost_usd,
+        result.model_b.cost_usd,
+        result.extra.get("avg_a"),
+        result.extra.get("avg_b"),
+        raw_json,
     )
-    conn.commit()
-    conn.close()
 
 def _to_jsonable(result: LLMComparisonResult) -> Any:
     return {
@@ -82,20 +137,12 @@ def _to_jsonable(result: LLMComparisonResult) -> Any:
         "winner": result.winner,
         "scores": result.scores,
         "extra": result.extra,
-        "model_a": {
-            "model": result.model_a.model,
-            "latency_ms": result.model_a.latency_ms,
-            "cost_usd": result.model_a.cost_usd,
-            "input_tokens": result.model_a.input_tokens,
-            "output_tokens": result.model_a.output_tokens,
-            "output": result.model_a.output,
-        },
-        "model_b": {
-            "model": result.model_b.model,
-            "latency_ms": result.model_b.latency_ms,
-            "cost_usd": result.model_b.cost_usd,
-            "input_tokens": result.model_b.input_tokens,
-            "output_tokens": result.model_b.output_tokens,
-            "output": result.model_b.output,
-        },
+        "model_a": _run_to_jsonable(result.model_a),
+        "model_b": _run_to_jsonable(result.model_b),
     }
+
+def _run_to_jsonable(run: LLMRunResult) -> dict[str, Any]:
+    # The prompt is shared by both runs and recoverable from the brief, so it isn't stored.
+    data = asdict(run)
+    data.pop("prompt", None)
+    return data
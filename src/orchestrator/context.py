@@ -0,0 +1,30 @@
+"""
+Flow-scoped resources shared by the orchestrator tasks.
+"""
+from dataclasses import dataclass
+from typing import Optional
+
+from openai import OpenAI
+
+from src.common.config import settings
+from src.llm_compare.evaluator import get_openai_client
+from src.publisher.wp_client import WordPressDotComClient
+
+
+@dataclass
+class OrchestratorContext:
+    """
+    The OpenAI/WordPress clients, built once per flow run so generate -> quality ->
+    publish reuse the same HTTP connection pools. SQLite access goes through the
+    storage modules' shared WAL connections rather than a connection of its own.
+    """
+
+    oai: Optional[OpenAI] = None
+    wp: Optional[WordPressDotComClient] = None
+
+
+def build_context(*, llm: bool = True, publish: bool = False) -> OrchestratorContext:
+    return OrchestratorContext(
+        oai=get_openai_client() if llm and settings.OPENAI_API_KEY else None,
+        wp=WordPressDotComClient() if publish else None,
+    )
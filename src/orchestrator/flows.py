@@ -2,18 +2,18 @@
 Prefect flow entrypoints for orchestrating the end-to-end content pipeline.
 """
 import json
-import sqlite3
 from pathlib import Path
 
 from prefect import flow, get_run_logger
 
+from src.orchestrator.context import build_context
 from src.orchestrator.tasks import (
     task_generate_from_brief,
     task_quality_gate,
     task_publish,
 )
-from src.publisher.storage import DB_PATH
-from src.publisher.telemetry import fetch_views
+from src.publisher.storage import DB_PATH, recent_published_posts
+from src.publisher.telemetry import fetch_views_many
 from src.common.config import settings
 
 
@@ -33,15 +33,17 @@ def ai_content_orchestrator_flow(
     The optional `tone` hint is forwarded to the LLM comparison prompt so editors
     can enforce voice/brand guidance.
     """
+    # One set of HTTP clients serves every stage of the run.
+    ctx = build_context(publish=auto_publish)
     # 1) generate
-    result_generate = task_generate_from_brief(brief, model_a, model_b, tone)
+    result_generate = task_generate_from_brief(brief, model_a, model_b, tone, ctx=ctx)
     if isinstance(result_generate, dict):
         optimized_path = result_generate.get("path")
     else:
         optimized_path = result_generate
 
     # 2) quality gate
-    result_quality = task_quality_gate(optimized_path)
+    result_quality = task_quality_gate(optimized_path, ctx=ctx)
     if isinstance(result_quality, dict):
         final_path = result_quality.get("path")
     else:
@@ -49,7 +51,7 @@ def ai_content_orchestrator_flow(
 
     # 3) publish (optional)
     if auto_publish:
-        publish_res = task_publish(final_path, status="publish")
+        publish_res = task_publish(final_path, status="publish", ctx=ctx)
         url = publish_res.get("url") if isinstance(publish_res, dict) else publish_res
         return {"status": "published", "url": url, "final_path": final_path}
     else:
@@ -71,23 +73,18 @@ def post_engagement_telemetry_flow(limit: int = 20):
         logger.warning("WP_DOTCOM_SITE is not configured; cannot fetch telemetry.")
         return
 
-    conn = sqlite3.connect(DB_PATH)
-    rows = conn.execute(
-        "SELECT wp_id, title FROM published_posts ORDER BY created_at DESC LIMIT ?",
-        (limit,),
-    ).fetchall()
-    conn.close()
-
+    rows = recent_published_posts(limit)
     if not rows:
         logger.info("No published posts to collect telemetry for.")
         return
 
+    # Fetch concurrently and log every datapoint in one transaction.
+    views_by_id, errors = fetch_views_many([wp_id for wp_id, _title in rows], site=site)
     for wp_id, title in rows:
-        try:
-            views = fetch_views(post_id=wp_id, site=site)
-            logger.info(f"Recorded {views} views for post '{title}' (wp_id={wp_id}).")
-        except Exception as exc:
-            logger.warning(f"Failed to fetch telemetry for wp_id={wp_id}: {exc}")
+        if wp_id in views_by_id:
+            logger.info(f"Recorded {views_by_id[wp_id]} views for post '{title}' (wp_id={wp_id}).")
+        else:
+            logger.warning(f"Failed to fetch telemetry for wp_id={wp_id}: {errors[wp_id]}")
 
 
 if __name__ == "__main__":
@@ -1,16 +1,21 @@
 """
 Prefect task definitions that back each stage of the orchestrator flow.
 """
-import json
+import re
 from datetime import datetime
 from pathlib import Path
 
 from openai import OpenAI
 from prefect import task
+from prefect.cache_policies import DEFAULT
+from prefect.context import FlowRunContext
 
+from src.common import jsonio
 from src.common.config import settings
-from src.llm_compare.evaluator import compare_models
+from src.llm_compare.evaluator import compare_models, compare_models_batched, get_openai_client
+from src.llm_compare.models import LLMComparisonResult
 from src.llm_compare.storage import save_result
+from src.orchestrator.context import OrchestratorContext
 from src.publisher.formatting import (
     ensure_markdown_toc,
     extract_introduction_excerpt,
@@ -20,26 +25,41 @@ from src.quality_agent.quality_runner import process_file
 
 QUALITY_MAX_REVISIONS = 2
 REVISION_MODEL = "gpt-5o"
-BAD_HEADING_MARKERS = ("H1:", "H2:", "H3:", "h1:", "h2:", "h3:")
+# Legacy "H1:"/"h2:"-style markers anywhere in the draft; one scan instead of six.
+BAD_HEADING_RE = re.compile(r"[Hh][123]:")
 
 
-@task(name="Generate draft via LLM compare")
+@task(name="Persist LLM comparison")
+def task_save_result(result: LLMComparisonResult) -> None:
+    save_result(result)
+
+
+@task(name="Generate draft via LLM compare", cache_policy=DEFAULT - "ctx")
 def task_generate_from_brief(
     brief: str,
     model_a: str,
     model_b: str,
     tone: str | None = None,
+    ctx: OrchestratorContext | None = None,
 ) -> str:
     """
     Compare two LLMs, persist the run metadata, and normalize the winning draft.
-    Optional `tone` guidance is forwarded to the LLM prompt when provided.
+    Optional `tone` guidance is forwarded to the LLM prompt when provided; `ctx`
+    supplies the flow's shared OpenAI client.
 
     Returns:
         Either a JSON summary dict (with `path`, metrics, and winner) or the raw
         optimized path if the downstream caller only needs the artifact.
     """
-    result = compare_models(brief, model_a, model_b, tone=tone)
-    save_result(result)
+    if settings.LLM_BATCH_MODE:
+        result = compare_models_batched([(brief, tone)], model_a, model_b)[0]
+    else:
+        result = compare_models(brief, model_a, model_b, tone=tone, client=ctx.oai if ctx else None)
+    # Inside a flow run, persist on Prefect's task runner while the draft is post-processed.
+    # Direct `.fn` callers (the Streamlit runner) have no task runner, so they save inline.
+    save_future = task_save_result.submit(result) if FlowRunContext.get() else None
+    if save_future is None:
+        save_result(result)
 
     winner = result.winner
     # `compare_models` keeps both structured outputs; choose the text from the winner.
@@ -78,7 +98,7 @@ def task_generate_from_brief(
         )
     out_path = Path("data/optimized") / f"{slug}.json"
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text(json.dumps(draft, indent=2, ensure_ascii=False), encoding="utf-8")
+    out_path.write_bytes(jsonio.dumps_bytes(draft))
     summary = {
         "path": str(out_path),
         "winner": winner,
@@ -88,11 +108,13 @@ def task_generate_from_brief(
         "quality_score": None,
         "tone": tone,
     }
+    if save_future is not None:
+        save_future.result()  # surface storage failures before reporting success
     return summary
 
 
-@task(name="Quality gate draft")
-def task_quality_gate(draft_path: str) -> str:
+@task(name="Quality gate draft", cache_policy=DEFAULT - "ctx")
+def task_quality_gate(draft_path: str, ctx: OrchestratorContext | None = None) -> str:
     """
     Run the quality agent and optionally invoke iterative GPT revisions.
     """
@@ -117,11 +139,17 @@ def task_quality_gate(draft_path: str) -> str:
         if attempts > QUALITY_MAX_REVISIONS:
             raise ValueError(f"Quality gate failed after revisions: {res['reasons']}")
 
-        current_path = _revise_draft_for_quality(current_path, res["reasons"], attempts)
+        current_path = _revise_draft_for_quality(
+            current_path, res["reasons"], attempts, client=ctx.oai if ctx else None
+        )
 
 
-@task(name="Publish to WordPress.com")
-def task_publish(final_path: str, status: str = "publish") -> str:
+@task(name="Publish to WordPress.com", cache_policy=DEFAULT - "ctx")
+def task_publish(
+    final_path: str,
+    status: str = "publish",
+    ctx: OrchestratorContext | None = None,
+) -> str:
     """
     Render sanitized HTML and push it to the WordPress.com REST API.
     """
@@ -129,7 +157,7 @@ def task_publish(final_path: str, status: str = "publish") -> str:
     from src.publisher.wp_client import WordPressDotComClient
 
     final_path = final_path.get("path") if isinstance(final_path, dict) else final_path
-    data = json.loads(Path(final_path).read_text(encoding="utf-8"))
+    data = jsonio.loads(Path(final_path).read_bytes())
     title = data.get("title", "Untitled")
     content = data.get("content", "")
     excerpt = extract_introduction_excerpt(content)
@@ -137,9 +165,9 @@ def task_publish(final_path: str, status: str = "publish") -> str:
     tags = data.get("tags")
     categories = data.get("categories")
 
-    client = WordPressDotComClient()
+    client = ctx.wp if ctx and ctx.wp else WordPressDotComClient()
     content_html = render_html(content, post_title=title)
-    if any(marker in content for marker in BAD_HEADING_MARKERS):
+    if BAD_HEADING_RE.search(content):
         print("[publisher] normalized draft with legacy heading markers")
     resp = client.create_post(
         title=title,
@@ -169,20 +197,25 @@ def task_publish(final_path: str, status: str = "publish") -> str:
     }
 
 
-def _revise_draft_for_quality(draft_path: str, reasons: list[str], attempt: int) -> str:
+def _revise_draft_for_quality(
+    draft_path: str,
+    reasons: list[str],
+    attempt: int,
+    client: OpenAI | None = None,
+) -> str:
     """
     Use GPT to revise the draft aiming to satisfy quality gate reasons.
     """
     if not settings.OPENAI_API_KEY:
         raise ValueError("OPENAI_API_KEY missing; cannot auto-revise failed draft.")
 
-    data = json.loads(Path(draft_path).read_text(encoding="utf-8"))
+    data = jsonio.loads(Path(draft_path).read_bytes())
     original_content = data.get("content", "")
     reasons_text = "\n".join(f"- {reason}" for reason in reasons)
 
-    client = OpenAI(api_key=settings.OPENAI_API_KEY)
+    client = client or get_openai_client()
     # Delegate the actual rewrite to a lighter-weight editing prompt so retries stay cheap.
-    response = client.chat.completions.create(
+    stream = client.chat.completions.create(
         model=REVISION_MODEL,
         messages=[
             {
@@ -208,10 +241,17 @@ Draft:
             },
         ],
         temperature=0.4,
+        stream=True,
     )
+    # Streaming keeps the connection busy instead of idling until the full rewrite is ready.
+    parts = [
+        chunk.choices[0].delta.content
+        for chunk in stream
+        if chunk.choices and chunk.choices[0].delta.content
+    ]
 
-    improved_content = response.choices[0].message.content.strip()
+    improved_content = "".join(parts).strip()
     data["content"] = ensure_markdown_toc(improved_content)
     data["quality_revision_attempt"] = attempt
-    Path(draft_path).write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+    Path(draft_path).write_bytes(jsonio.dumps_bytes(data))
     return draft_path
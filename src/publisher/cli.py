@@ -1,9 +1,9 @@
 # src/publisher/cli.py
 import argparse
-import json
 from datetime import datetime
 from pathlib import Path
 
+from src.common import jsonio
 from src.publisher.wp_client import WordPressDotComClient
 from src.publisher.storage import log_published
 from src.publisher.formatting import render_html, extract_introduction_excerpt
@@ -14,7 +14,7 @@ def main():
     parser.add_argument("--status", default="publish", help="WP post status, e.g. publish|draft")
     args = parser.parse_args()
 
-    data = json.loads(Path(args.input).read_text(encoding="utf-8"))
+    data = jsonio.loads(Path(args.input).read_bytes())
     title = data.get("title", "Untitled")
     raw_content = data.get("content", "")
     excerpt = extract_introduction_excerpt(raw_content)
@@ -1,6 +1,9 @@
 # src/publisher/storage.py
 import sqlite3
+import threading
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Iterator
 import json
 
 DB_PATH = Path("data/runs.sqlite")
@@ -28,25 +31,64 @@ CREATE TABLE IF NOT EXISTS post_views (
 );
 """
 
+_conn: sqlite3.Connection | None = None
+_conn_lock = threading.Lock()
+
+def _get_conn() -> sqlite3.Connection:
+    """
+    Process-wide connection, opened (and the schema created) on first use. WAL +
+    synchronous=NORMAL avoids a full fsync per commit; hold `_conn_lock` while using it.
+    """
+    global _conn
+    if _conn is None:
+        DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute(POSTS_SCHEMA)
+        conn.execute(POST_VIEWS_SCHEMA)
+        conn.commit()
+        _conn = conn
+    return _conn
+
 def init_db():
-    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(DB_PATH)
-    conn.execute(POSTS_SCHEMA)
-    conn.execute(POST_VIEWS_SCHEMA)
-    conn.commit()
-    conn.close()
+    with _conn_lock:
+        _get_conn()
+
+@contextmanager
+def transaction(conn: sqlite3.Connection | None = None) -> Iterator[sqlite3.Connection]:
+    """
+    Yield `conn` (schema already in place), or the shared connection under its lock,
+    inside a transaction that commits on success.
+    """
+    if conn is not None:
+        with conn:
+            yield conn
+        return
+    with _conn_lock:
+        shared = _get_conn()
+        with shared:
+            yield shared
 
 def log_published(created_at: str, wp_id: int, wp_link: str,
-                  slug: str, title: str, source_file: str, raw_json: dict):
-    init_db()
-    conn = sqlite3.connect(DB_PATH)
-    conn.execute(
-        """
-        INSERT INTO published_posts (
-            created_at, wp_id, wp_link, slug, title, source_file, raw_json
-        ) VALUES (?, ?, ?, ?, ?, ?, ?)
-        """,
-        (created_at, wp_id, wp_link, slug, title, source_file, json.dumps(raw_json)),
-    )
-    conn.commit()
-    conn.close()
+                  slug: str, title: str, source_file: str, raw_json: dict,
+                  conn: sqlite3.Connection | None = None):
+    """Insert a published post; pass `conn` to use a caller-owned connection."""
+    with transaction(conn) as db:
+        db.execute(
+            """
+            INSERT INTO published_posts (
+                created_at, wp_id, wp_link, slug, title, source_file, raw_json
+            ) VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            (created_at, wp_id, wp_link, slug, title, source_file, json.dumps(raw_json)),
+        )
+
+def recent_published_posts(limit: int) -> list[tuple[int, str]]:
+    """`(wp_id, title)` of the most recently published posts, newest first."""
+    with _conn_lock:
+        return _get_conn().execute(
+            "SELECT wp_id, title FROM published_posts ORDER BY created_at DESC LIMIT ?",
+            (limit,),
+        ).fetchall()
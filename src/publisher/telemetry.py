@@ -7,17 +7,45 @@ from __future__ import annotations
 
 import datetime as dt
 import sqlite3
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Optional
 
 import requests
 
 from src.common.config import settings
-from src.publisher.storage import DB_PATH, init_db
+from src.publisher.storage import transaction
 
 STATS_ENDPOINT = "https://public-api.wordpress.com/rest/v1.1/sites/{site}/stats/post/{post_id}"
+POST_VIEWS_INSERT_SQL = """
+INSERT INTO post_views (post_id, site, views, fetched_at)
+VALUES (?, ?, ?, ?)
+"""
+
+
+def _stats_headers() -> dict[str, str]:
+    headers = {"Content-Type": "application/json"}
+    token = settings.WP_DOTCOM_BEARER
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    return headers
 
 
-def fetch_views(post_id: int, site: Optional[str] = None, timeout: int = 10) -> int:
+def _request_views(http, post_id: int, site: str, timeout: int) -> int:
+    """GET the stats endpoint via `http` (the requests module or a Session)."""
+    url = STATS_ENDPOINT.format(site=site, post_id=post_id)
+    resp = http.get(url, headers=_stats_headers(), timeout=timeout)
+    if not resp.ok:
+        raise RuntimeError(f"Failed to fetch stats for post {post_id}: {resp.status_code} {resp.text}")
+    payload = resp.json()
+    return int(payload.get("views", 0))
+
+
+def fetch_views(
+    post_id: int,
+    site: Optional[str] = None,
+    timeout: int = 10,
+    conn: Optional[sqlite3.Connection] = None,
+) -> int:
     """
     Fetch view counts for a WordPress.com post and log them to SQLite.
 
@@ -27,36 +55,76 @@ def fetch_views(post_id: int, site: Optional[str] = None, timeout: int = 10) ->
     if not site:
         raise ValueError("WP_DOTCOM_SITE must be configured to collect telemetry.")
 
-    headers = {"Content-Type": "application/json"}
-    token = settings.WP_DOTCOM_BEARER
-    if token:
-        headers["Authorization"] = f"Bearer {token}"
+    views = _request_views(requests, post_id, site, timeout)
+    log_post_views(post_id=post_id, site=site, views=views, conn=conn)
+    return views
 
-    url = STATS_ENDPOINT.format(site=site, post_id=post_id)
-    resp = requests.get(url, headers=headers, timeout=timeout)
-    if not resp.ok:
-        raise RuntimeError(f"Failed to fetch stats for post {post_id}: {resp.status_code} {resp.text}")
 
-    payload = resp.json()
-    views = int(payload.get("views", 0))
-    log_post_views(post_id=post_id, site=site, views=views)
-    return views
+def fetch_views_many(
+    post_ids: Iterable[int],
+    site: Optional[str] = None,
+    timeout: int = 10,
+    max_workers: int = 8,
+    conn: Optional[sqlite3.Connection] = None,
+) -> tuple[dict[int, int], dict[int, Exception]]:
+    """
+    Fetch view counts for many posts concurrently over one pooled `requests.Session`
+    and log every successful datapoint in a single transaction.
+
+    Returns `(views_by_post_id, errors_by_post_id)`.
+    """
+    site = site or settings.WP_DOTCOM_SITE
+    if not site:
+        raise ValueError("WP_DOTCOM_SITE must be configured to collect telemetry.")
 
+    post_ids = list(post_ids)
+    views_by_id: dict[int, int] = {}
+    errors: dict[int, Exception] = {}
+    if not post_ids:
+        return views_by_id, errors
 
-def log_post_views(post_id: int, site: str, views: int, fetched_at: Optional[dt.datetime] = None) -> None:
+    with requests.Session() as session, ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {
+            post_id: pool.submit(_request_views, session, post_id, site, timeout)
+            for post_id in post_ids
+        }
+        for post_id, future in futures.items():
+            try:
+                views_by_id[post_id] = future.result()
+            except Exception as exc:
+                errors[post_id] = exc
+
+    # One timestamp for the whole batch rather than one per row.
+    fetched_at = dt.datetime.now(dt.timezone.utc).isoformat()
+    log_post_views_many(
+        [(post_id, site, views, fetched_at) for post_id, views in views_by_id.items()],
+        conn=conn,
+    )
+    return views_by_id, errors
+
+
+def log_post_views(
+    post_id: int,
+    site: str,
+    views: int,
+    fetched_at: Optional[dt.datetime] = None,
+    conn: Optional[sqlite3.Connection] = None,
+) -> None:
     """
     Persist a telemetry datapoint to SQLite.
+
+    Pass `conn` to use a caller-owned connection whose schema is already in place.
     """
-    init_db()
-    fetched_at = fetched_at or dt.datetime.utcnow()
-    conn = sqlite3.connect(DB_PATH)
-    conn.execute(
-        """
-        INSERT INTO post_views (post_id, site, views, fetched_at)
-        VALUES (?, ?, ?, ?)
-        """,
-        (post_id, site, views, fetched_at.isoformat()),
-    )
-    conn.commit()
-    conn.close()
+    fetched_at = fetched_at or dt.datetime.now(dt.timezone.utc)
+    log_post_views_many([(post_id, site, views, fetched_at.isoformat())], conn=conn)
+
 
+def log_post_views_many(
+    rows: Iterable[tuple[int, str, int, str]],
+    conn: Optional[sqlite3.Connection] = None,
+) -> None:
+    """
+    Persist `(post_id, site, views, fetched_at_iso)` rows in a single transaction.
+    """
+    with transaction(conn) as db:
+        db.executemany(POST_VIEWS_INSERT_SQL, rows)
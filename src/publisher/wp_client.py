@@ -2,12 +2,41 @@
 from __future__ import annotations
 
 import re
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
 from requests import RequestException
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from src.common.config import settings
 
 
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+TERM_RESOLVE_WORKERS = 6
+SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+
+def _build_session(token: str) -> requests.Session:
+    """
+    Pooled session carrying the auth headers. Transient statuses are retried for
+    idempotent methods only (urllib3's default), so a POST is never sent twice.
+    """
+    session = requests.Session()
+    session.headers.update({
+        "Authorization": f"Bearer {token}",
+        "Content-Type": "application/json",
+    })
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=RETRY_STATUS_CODES,
+        raise_on_status=False,
+    )
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry))
+    return session
+
+
 class WordPressDotComClient:
     REQUEST_TIMEOUT = 15
 
@@ -22,6 +51,9 @@ class WordPressDotComClient:
 
         self.api_base = api_base.rstrip("/")
         self.token = token
+        self._session = _build_session(token)
+        # (taxonomy, lowercased name) -> term id, filled as terms are found or created.
+        self._term_cache: dict[tuple[str, str], int] = {}
 
     def create_post(
         self,
@@ -49,9 +81,8 @@ class WordPressDotComClient:
             payload["categories"] = self._resolve_terms(categories, "categories")
 
         try:
-            resp = requests.post(
+            resp = self._session.post(
                 url,
-                headers=self._headers(),
                 json=payload,
                 timeout=self.REQUEST_TIMEOUT,
             )
@@ -72,10 +103,25 @@ class WordPressDotComClient:
         Convert provided tags/categories into numeric IDs, creating new terms if needed.
         Accepts integers (returned as-is) and strings (treated as names).
         """
-        resolved: list[int] = []
         if not isinstance(terms, (list, tuple, set)):
             terms = [terms]
 
+        # Each unique name is looked up once; lookups run concurrently over the pooled
+        # session since every one is a GET (plus a POST when the term is new).
+        names: dict[str, str] = {}
+        for term in terms:
+            if isinstance(term, str):
+                names.setdefault(term.strip().lower(), term.strip())
+        found: dict[str, int | None] = {}
+        if names:
+            with ThreadPoolExecutor(max_workers=min(TERM_RESOLVE_WORKERS, len(names))) as pool:
+                futures = {
+                    key: pool.submit(self._ensure_term, taxonomy, name)
+                    for key, name in names.items()
+                }
+                found = {key: future.result() for key, future in futures.items()}
+
+        resolved: list[int] = []
         for term in terms:
             if isinstance(term, int):
                 resolved.append(term)
@@ -85,7 +131,7 @@ class WordPressDotComClient:
                 print(f"[publisher] Skipping unsupported term value for {taxonomy}: {term}")
                 continue
 
-            term_id = self._ensure_term(taxonomy, term.strip())
+            term_id = found[term.strip().lower()]
             if term_id is not None:
                 resolved.append(term_id)
             else:
@@ -94,10 +140,16 @@ class WordPressDotComClient:
         return resolved
 
     def _ensure_term(self, taxonomy: str, name: str) -> int | None:
-        existing = self._find_term(taxonomy, name)
-        if existing is not None:
-            return existing
-        return self._create_term(taxonomy, name)
+        key = (taxonomy, name.strip().lower())
+        cached = self._term_cache.get(key)
+        if cached is not None:
+            return cached
+        term_id = self._find_term(taxonomy, name)
+        if term_id is None:
+            term_id = self._create_term(taxonomy, name)
+        if term_id is not None:
+            self._term_cache[key] = term_id
+        return term_id
 
     def _find_term(self, taxonomy: str, name: str) -> int | None:
         slug = self._slugify(name)
@@ -105,9 +157,8 @@ class WordPressDotComClient:
         if slug:
             params["slug"] = slug
         try:
-            resp = requests.get(
+            resp = self._session.get(
                 f"{self.api_base}/{taxonomy}",
-                headers=self._headers(),
                 params=params,
                 timeout=self.REQUEST_TIMEOUT,
             )
@@ -134,9 +185,8 @@ class WordPressDotComClient:
         if slug:
             payload["slug"] = slug
         try:
-            resp = requests.post(
+            resp = self._session.post(
                 f"{self.api_base}/{taxonomy}",
-                headers=self._headers(),
                 json=payload,
                 timeout=self.REQUEST_TIMEOUT,
             )
@@ -158,13 +208,7 @@ class WordPressDotComClient:
         data = resp.json()
         return data.get("id")
 
-    def _headers(self) -> dict[str, str]:
-        return {
-            "Authorization": f"Bearer {self.token}",
-            "Content-Type": "application/json",
-        }
-
     @staticmethod
     def _slugify(value: str) -> str:
-        slug = re.sub(r"[^a-z0-9]+", "-", value.strip().lower())
+        slug = SLUG_RE.sub("-", value.strip().lower())
         return slug.strip("-")
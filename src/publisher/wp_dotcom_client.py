@@ -3,10 +3,34 @@ import json
 
 import requests
 from requests import RequestException
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from src.common.config import settings
 
 
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+def _build_session(token: str | None) -> requests.Session:
+    """
+    Pooled session carrying the auth headers. Transient statuses are retried for
+    idempotent methods only (urllib3's default), so a POST is never sent twice.
+    """
+    session = requests.Session()
+    session.headers["Content-Type"] = "application/json"
+    if token:
+        session.headers["Authorization"] = f"Bearer {token}"
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=RETRY_STATUS_CODES,
+        raise_on_status=False,
+    )
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry))
+    return session
+
+
 class WordPressDotComClient:
     REQUEST_TIMEOUT = 10
 
@@ -15,20 +39,12 @@ class WordPressDotComClient:
             raise ValueError("WP_DOTCOM_API_BASE is not set")
         self.base_url = settings.WP_DOTCOM_API_BASE.rstrip("/")
         self.token = settings.WP_DOTCOM_BEARER
-
-    def _headers(self):
-        headers = {
-            "Content-Type": "application/json",
-        }
-        if self.token:
-            headers["Authorization"] = f"Bearer {self.token}"
-        return headers
+        self._session = _build_session(self.token)
 
     def ping(self):
         # simple GET to make sure site is reachable
-        resp = requests.get(
+        resp = self._session.get(
             f"{self.base_url}/posts",
-            headers=self._headers(),
             timeout=self.REQUEST_TIMEOUT,
         )
         resp.raise_for_status()
@@ -48,9 +64,8 @@ class WordPressDotComClient:
 
         for label, url in endpoints:
             try:
-                resp = requests.get(
+                resp = self._session.get(
                     url,
-                    headers=self._headers(),
                     timeout=self.REQUEST_TIMEOUT,
                 )
             except RequestException as exc:
@@ -88,9 +103,8 @@ class WordPressDotComClient:
             payload["slug"] = slug
 
         try:
-            resp = requests.post(
+            resp = self._session.post(
                 f"{self.base_url}/posts",
-                headers=self._headers(),
                 json=payload,
                 timeout=self.REQUEST_TIMEOUT,
             )
@@ -107,9 +121,8 @@ class WordPressDotComClient:
             raise TypeError("payload must be a dict")
 
         try:
-            resp = requests.post(
+            resp = self._session.post(
                 f"{self.base_url}/posts",
-                headers=self._headers(),
                 json=payload,
                 timeout=self.REQUEST_TIMEOUT,
             )
@@ -1,8 +1,33 @@
 # src/quality_agent/plagiarism.py
+import sqlite3
+import zlib
+from array import array
+from operator import methodcaller
 from pathlib import Path
 
+from src.common import jsonio
+
+# final_dir -> (signature of its *.json files, union of their hashed n-grams)
+_CORPUS_CACHE: dict[str, tuple[tuple, frozenset]] = {}
+
+# Per-file n-gram sets persisted next to the drafts, keyed by file name + mtime + size.
+NGRAM_INDEX_NAME = ".ngram_index.sqlite"
+NGRAM_INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS ngram_index (
+    name TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    ngrams BLOB NOT NULL
+);
+"""
+
+_encode = methodcaller("encode", "utf-8", "surrogatepass")
+
 def _ngrams(tokens, n=5):
-    return {" ".join(tokens[i:i+n]) for i in range(len(tokens)-n+1)}
+    # Shingles are ints, not joined strings: tokens get a crc32 (stable across processes,
+    # unlike str hashes) and each run of n token hashes is hashed as a tuple, all in C.
+    token_hashes = list(map(zlib.crc32, map(_encode, tokens)))
+    return set(map(hash, zip(*(token_hashes[k:] for k in range(n)))))
 
 def load_existing_texts(final_dir: str = "data/final"):
     base = Path(final_dir)
@@ -11,14 +36,101 @@ def load_existing_texts(final_dir: str = "data/final"):
     texts = []
     for p in base.glob("*.json"):
         try:
-            import json
-            data = json.loads(p.read_text(encoding="utf-8"))
+            data = jsonio.loads(p.read_bytes())
             texts.append(data.get("content", ""))
         except Exception:
             continue
     return texts
 
-def plagiarism_score(content: str, final_dir: str = "data/final") -> float:
+def _corpus_signature(final_dir: str) -> tuple:
+    # Names + mtimes + sizes catch added, removed and rewritten files with stats only.
+    base = Path(final_dir)
+    if not base.exists():
+        return ()
+    entries = []
+    for p in base.glob("*.json"):
+        try:
+            st = p.stat()
+        except OSError:
+            continue
+        entries.append((p.name, st.st_mtime_ns, st.st_size))
+    return tuple(sorted(entries))
+
+def _file_ngrams(path: Path) -> set:
+    try:
+        data = jsonio.loads(path.read_bytes())
+    except Exception:
+        return set()
+    if not isinstance(data, dict):
+        return set()
+    return _ngrams((data.get("content") or "").split(), n=5)
+
+def _indexed_ngrams(base: Path, signature: tuple) -> set:
+    """
+    Union of per-file n-grams, reading unchanged files' sets from the on-disk index
+    and re-parsing only files whose mtime/size changed since they were indexed.
+    """
+    conn = sqlite3.connect(base / NGRAM_INDEX_NAME)
+    try:
+        conn.execute(NGRAM_INDEX_SCHEMA)
+        indexed = {
+            name: (mtime_ns, size, blob)
+            for name, mtime_ns, size, blob in conn.execute(
+                "SELECT name, mtime_ns, size, ngrams FROM ngram_index"
+            )
+        }
+        corpus = set()
+        fresh = []
+        for name, mtime_ns, size in signature:
+            row = indexed.pop(name, None)
+            if row is not None and row[0] == mtime_ns and row[1] == size:
+                grams = array("q")
+                grams.frombytes(row[2])
+                corpus.update(grams)
+                continue
+            grams = _file_ngrams(base / name)
+            corpus |= grams
+            fresh.append((name, mtime_ns, size, array("q", grams).tobytes()))
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO ngram_index (name, mtime_ns, size, ngrams) VALUES (?, ?, ?, ?)",
+                fresh,
+            )
+            conn.executemany("DELETE FROM ngram_index WHERE name = ?", [(name,) for name in indexed])
+        return corpus
+    finally:
+        conn.close()
+
+def load_corpus_ngrams(final_dir: str = "data/final") -> frozenset:
+    """
+    Union of the 5-grams of every published draft, rebuilt only when `final_dir` changes.
+    Batch callers can compute this once and pass it to `plagiarism_score`.
+    """
+    signature = _corpus_signature(final_dir)
+    cached = _CORPUS_CACHE.get(final_dir)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    base = Path(final_dir)
+    if not signature:
+        corpus = frozenset()
+    else:
+        try:
+            corpus = frozenset(_indexed_ngrams(base, signature))
+        except sqlite3.Error:
+            # Unwritable or corrupt index: fall back to parsing every draft.
+            existing_ngrams = set()
+            for name, _mtime_ns, _size in signature:
+                existing_ngrams |= _file_ngrams(base / name)
+            corpus = frozenset(existing_ngrams)
+    _CORPUS_CACHE[final_dir] = (signature, corpus)
+    return corpus
+
+def plagiarism_score(
+    content: str,
+    final_dir: str = "data/final",
+    corpus_ngrams: frozenset | None = None,
+) -> float:
     """
     Returns % of ngrams that collide with existing ones.
     Lower is better.
@@ -28,10 +140,7 @@ def plagiarism_score(content: str, final_dir: str = "data/final") -> float:
     if not this_ngrams:
         return 0.0
 
-    existing_texts = load_existing_texts(final_dir)
-    existing_ngrams = set()
-    for txt in existing_texts:
-        existing_ngrams |= _ngrams(txt.split(), n=5)
+    existing_ngrams = corpus_ngrams if corpus_ngrams is not None else load_corpus_ngrams(final_dir)
 
     if not existing_ngrams:
         return 0.0
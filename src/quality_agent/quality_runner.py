@@ -12,13 +12,17 @@ SEO_THRESHOLD = int(os.environ.get("SEO_THRESHOLD", 70))
 QUALITY_THRESHOLD = int(os.environ.get("QUALITY_THRESHOLD", 75))
 
 
-def evaluate_draft(draft: Dict[str, Any]) -> Dict[str, Any]:
+def evaluate_draft(draft: Dict[str, Any], corpus_ngrams: frozenset | None = None) -> Dict[str, Any]:
+    """
+    Score a draft; batch callers may pass `corpus_ngrams` from `load_corpus_ngrams`
+    to share one plagiarism corpus across drafts.
+    """
     content = draft.get("content", "")
     brief = draft.get("brief") or draft.get("title") or ""
 
     read_score = readability_score(content)
     rel_score = relevance_score(brief, content)
-    plag_score = plagiarism_score(content)
+    plag_score = plagiarism_score(content, corpus_ngrams=corpus_ngrams)
     seo_score = draft.get("seo_score", 60)
 
     # give a small bonus to well-structured posts
@@ -87,7 +91,7 @@ def process_file(
     if result["passes"]:
         out_path = Path(final_dir) / f"{slug}.json"
         draft["quality_meta"] = result
-        save_json(draft, str(out_path))
+        save_json(draft, out_path)
     else:
         out_path = Path(rejected_dir) / f"{slug}.json"
         save_json(
@@ -95,7 +99,9 @@ def process_file(
                 "draft": draft,
                 "quality_meta": result,
             },
-            str(out_path),
+            out_path,
+            # Rejected drafts are reviewed by hand.
+            pretty=True,
         )
 
     return result
@@ -1,6 +1,14 @@
 # src/quality_agent/readability.py
 import re
 
+WORD_RE = re.compile(r"\w+")
+# Syllables are counted over the whole text at once instead of word by word: a
+# vowel run never spans a word boundary, so the per-word rules reduce to three counts.
+VOWEL_RUN_RE = re.compile(r"[aeiouyAEIOUY]+")
+NO_VOWEL_WORD_RE = re.compile(r"(?<!\w)[^\WaeiouyAEIOUY]+(?!\w)")
+# Words ending in "e" with at least two vowel runs lose one syllable.
+SILENT_E_RE = re.compile(r"[aeiouyAEIOUY][^\WaeiouyAEIOUY]+[aeiouyAEIOUY]*[eE](?!\w)")
+
 def count_syllables(word: str) -> int:
     word = word.lower()
     vowels = "aeiouy"
@@ -15,11 +23,21 @@ def count_syllables(word: str) -> int:
         count = max(1, count - 1)
     return max(count, 1)
 
+def _total_syllables(text: str) -> int:
+    """Equivalent to summing `count_syllables` over every `\\w+` word of `text`."""
+    if "\u0130" in text:
+        # "İ" lowercases to "i" plus a combining dot; keep the per-word path for it.
+        return sum(map(count_syllables, WORD_RE.findall(text)))
+    return (
+        len(VOWEL_RUN_RE.findall(text))
+        + len(NO_VOWEL_WORD_RE.findall(text))
+        - len(SILENT_E_RE.findall(text))
+    )
+
 def flesch_reading_ease(text: str) -> float:
     sentences = max(1, text.count(".") + text.count("!") + text.count("?"))
-    words = re.findall(r"\w+", text)
-    num_words = max(1, len(words))
-    syllables = sum(count_syllables(w) for w in words)
+    num_words = max(1, len(WORD_RE.findall(text)))
+    syllables = _total_syllables(text)
     # Flesch Reading Ease
     return 206.835 - 1.015 * (num_words / sentences) - 84.6 * (syllables / num_words)
 
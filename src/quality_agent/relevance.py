@@ -3,12 +3,21 @@ import re
 from collections import Counter
 import math
 
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+
 def _normalize(text: str):
-    return re.findall(r"[a-zA-Z0-9]+", text.lower())
+    # Lowercase once, then a single C-level findall; feeding Counter a finditer
+    # generator instead measured ~2x slower than counting the materialized list.
+    return TOKEN_RE.findall(text.lower())
 
 def _cosine(a: Counter, b: Counter) -> float:
-    common = set(a.keys()) & set(b.keys())
-    num = sum(a[t] * b[t] for t in common)
+    # One pass over the smaller vector with dict lookups into the larger one.
+    small, large = (a, b) if len(a) <= len(b) else (b, a)
+    num = 0
+    for tok, v in small.items():
+        w = large.get(tok)
+        if w:
+            num += v * w
     den_a = math.sqrt(sum(v*v for v in a.values()))
     den_b = math.sqrt(sum(v*v for v in b.values()))
     if den_a == 0 or den_b == 0:
@@ -23,19 +32,18 @@ def relevance_score(brief: str, content: str) -> float:
     returns 0-100
     """
     brief_tokens = _normalize(brief)
-    content_tokens = _normalize(content)
+    vec_content = Counter(_normalize(content))
 
-    if not brief_tokens or not content_tokens:
+    if not brief_tokens or not vec_content:
         return 0.0
 
+    vec_brief = Counter(brief_tokens)
+
     # 1) keyword coverage: how many brief words appear in content
-    content_set = set(content_tokens)
-    covered = sum(1 for t in brief_tokens if t in content_set)
+    covered = sum(1 for t in brief_tokens if t in vec_content)
     coverage_ratio = covered / len(brief_tokens)  # 0..1
 
     # 2) cosine (light)
-    vec_brief = Counter(brief_tokens)
-    vec_content = Counter(content_tokens)
     cos = _cosine(vec_brief, vec_content)  # 0..1
 
     # weight: coverage is more important for short briefs
@@ -1,14 +1,63 @@
 # src/quality_agent/utils.py
-import json
-from pathlib import Path
+import os
+import stat
+import tempfile
+from functools import lru_cache
 from typing import Dict, Any
 
-def load_draft(path: str) -> Dict[str, Any]:
-    p = Path(path)
-    data = json.loads(p.read_text(encoding="utf-8"))
+from src.common import jsonio
+
+# os.umask can only be read by setting it, so sample it once at import, before any threads.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+@lru_cache(maxsize=128)
+def _read_draft_bytes(path: str, mtime_ns: int, size: int) -> bytes:
+    # mtime/size are part of the key so a rewritten file is read again.
+    with open(path, "rb") as f:
+        return f.read()
+
+def load_draft_bytes(path: str | os.PathLike[str]) -> bytes:
+    """Raw JSON bytes of a draft file, served from cache while the file is unchanged."""
+    path = os.fspath(path)
+    st = os.stat(path)
+    return _read_draft_bytes(path, st.st_mtime_ns, st.st_size)
+
+def load_draft(path: str | os.PathLike[str]) -> Dict[str, Any]:
+    # Only the raw bytes are cached: re-parsing them with orjson is ~4x cheaper than
+    # deep-copying a cached dict, and every caller gets its own mutable draft.
+    data = jsonio.loads(load_draft_bytes(path))
     return data
 
-def save_json(obj, path: str):
-    p = Path(path)
-    p.parent.mkdir(parents=True, exist_ok=True)
-    p.write_text(json.dumps(obj, indent=2, ensure_ascii=False), encoding="utf-8")
+def _dump_to_path(obj, path: str, pretty: bool = False) -> None:
+    # Encode the whole document first, then write it once; json.dump(obj, f) would
+    # issue a write() per token. The write goes to a uniquely named sibling temp file
+    # that is renamed over `path`, so readers never see a truncated draft and concurrent
+    # writers never share a temp file.
+    tmp = None
+    try:
+        with tempfile.NamedTemporaryFile(
+            dir=os.path.dirname(path) or ".", prefix=os.path.basename(path) + ".", suffix=".tmp", delete=False
+        ) as f:
+            tmp = f.name
+            f.write(jsonio.dumps_bytes(obj, indent=pretty))
+            # NamedTemporaryFile is owner-only (0600); give the draft the mode a plain
+            # open() would have, keeping an existing file's mode when replacing it.
+            os.fchmod(f.fileno(), _target_mode(path))
+        os.replace(tmp, path)
+        tmp = None
+    finally:
+        if tmp is not None:  # the write or rename failed; don't leave the temp file behind
+            os.unlink(tmp)
+
+def _target_mode(path: str) -> int:
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        return 0o666 & ~_UMASK
+
+def save_json(obj, path: str | os.PathLike[str], pretty: bool = False):
+    """Write `obj` as compact JSON; pass `pretty=True` for files meant to be read by people."""
+    path = os.fspath(path)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    _dump_to_path(obj, path, pretty=pretty)
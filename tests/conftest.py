@@ -0,0 +1,24 @@
+# tests/conftest.py
+import sys
+from pathlib import Path
+
+import pytest
+
+# Make `src` importable once per session instead of in every test module.
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+
+@pytest.fixture(scope="session")
+def evaluated_sample():
+    """Quality metrics for a minimal draft, computed once and shared across tests."""
+    from src.quality_agent.quality_runner import evaluate_draft
+
+    draft = {
+        "title": "Test",
+        "brief": "Test brief",
+        "content": "This is a short test content about WordPress AI.",
+        "seo_score": 75,
+    }
+    return evaluate_draft(draft)
@@ -1,9 +1,3 @@
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
-
-
 from src.publisher.formatting import (
     ensure_markdown_toc,
     extract_introduction_excerpt,
@@ -198,3 +192,21 @@ def test_extract_introduction_excerpt_missing_heading_returns_blank():
 Text
 """
     assert extract_introduction_excerpt(src) == ""
+
+
+def test_extract_introduction_excerpt_comment_only_intro_returns_blank():
+    src = "## Introduction\n<!-- draft note -->\n\n## Main Section\nBody"
+    assert extract_introduction_excerpt(src) == ""
+
+
+def test_extract_introduction_excerpt_skips_script_and_style():
+    src = """## Introduction
+<script>var a=1;</script>
+<style>p { color: red; }</style>
+
+Text
+
+## Main Section
+Body
+"""
+    assert extract_introduction_excerpt(src) == "Text"
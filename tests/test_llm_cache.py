@@ -0,0 +1,28 @@
+from dataclasses import replace
+
+import pytest
+
+from src.llm_compare import cache as llm_cache
+
+
+def test_cache_round_trip(tmp_path):
+    db_path = tmp_path / "cache.sqlite"
+    key = llm_cache.cache_key("gpt-5o-mini", "hello")
+    assert llm_cache.get(key, db_path) is None
+
+    llm_cache.put(key, "gpt-5o-mini", "hello", "## Out", 12, 34, db_path)
+    assert llm_cache.get(key, db_path) == ("## Out", 12, 34)
+    assert llm_cache.get(llm_cache.cache_key("gpt-5o", "hello"), db_path) is None
+
+
+def test_cache_hit_is_free_and_flagged(monkeypatch):
+    evaluator = pytest.importorskip("src.llm_compare.evaluator")
+    monkeypatch.setattr(evaluator, "settings", replace(evaluator.settings, LLM_CACHE="exact"))
+    monkeypatch.setattr(llm_cache, "get", lambda key: ("## Out", 12, 34))
+
+    # No client: a cache hit must not touch the API.
+    run = evaluator.call_model(None, "gpt-5o-mini", [{"role": "user", "content": "hello"}])
+    assert run.output == "## Out"
+    assert run.cached is True
+    assert run.cost_usd == 0.0
+    assert run.first_token_ms is None
@@ -0,0 +1,42 @@
+import threading
+
+import pytest
+
+evaluator = pytest.importorskip("src.llm_compare.evaluator")
+
+
+def _open_breaker(monkeypatch, now):
+    breaker = evaluator._CircuitBreaker(threshold=2, cooldown_s=10)
+    monkeypatch.setattr(evaluator.time, "monotonic", lambda: now[0])
+    breaker.record_failure()
+    breaker.record_failure()
+    assert not breaker.allow()
+    now[0] += 10
+    return breaker
+
+
+def test_half_open_breaker_admits_a_single_trial(monkeypatch):
+    breaker = _open_breaker(monkeypatch, [100.0])
+
+    allowed = []
+    threads = [threading.Thread(target=lambda: allowed.append(breaker.allow())) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert allowed.count(True) == 1
+
+    breaker.record_success()
+    assert breaker.allow() and breaker.allow()
+
+
+def test_failed_trial_reopens_breaker(monkeypatch):
+    now = [100.0]
+    breaker = _open_breaker(monkeypatch, now)
+    assert breaker.allow()
+    breaker.record_failure()
+    assert not breaker.allow()
+
+    now[0] += 10
+    assert breaker.allow()
+    assert not breaker.allow()
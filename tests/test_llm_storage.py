@@ -0,0 +1,52 @@
+import gzip
+import sqlite3
+
+import pytest
+
+from src.common import jsonio
+from src.llm_compare import storage
+from src.llm_compare.models import LLMComparisonResult, LLMRunResult
+
+
+def _result(created_at: str) -> LLMComparisonResult:
+    run = LLMRunResult("gpt-5o-mini", "prompt", "## Out", 10, 1, 2, 0.01)
+    return LLMComparisonResult("brief", run, run, {}, "gpt-5o-mini", created_at, {"avg_a": 1, "avg_b": 1})
+
+
+def test_save_results_appends_stream_and_rows(tmp_path, monkeypatch):
+    runs_dir = tmp_path / "runs"
+    monkeypatch.setattr(storage, "DB_PATH", tmp_path / "runs.sqlite")
+    monkeypatch.setattr(storage, "RUNS_DIR", runs_dir)
+    monkeypatch.setattr(storage, "RUNS_STREAM", runs_dir / "runs.jsonl.gz")
+    monkeypatch.setattr(storage, "_conn", None)
+
+    runs_dir.mkdir()
+    (runs_dir / "llm_run_legacy.json").write_text('{"brief": "old"}', encoding="utf-8")
+    storage.save_result(_result("t0"))
+    storage.save_results([_result("t1"), _result("t2")])
+    assert storage.migrate_legacy_runs() == 1
+    assert storage.load_run(2)["created_at"] == "t1"
+    storage._conn.close()
+
+    with gzip.open(runs_dir / "runs.jsonl.gz", "rb") as f:
+        lines = [jsonio.loads(line) for line in f.read().splitlines()]
+    assert [line.get("created_at") for line in lines] == ["t0", "t1", "t2", None]
+    assert not list(runs_dir.glob("llm_run_*.json"))
+    with sqlite3.connect(tmp_path / "runs.sqlite") as conn:
+        assert conn.execute("SELECT COUNT(*) FROM llm_runs").fetchone() == (3,)
+
+
+def test_failed_insert_does_not_append_stream(tmp_path, monkeypatch):
+    runs_dir = tmp_path / "runs"
+    monkeypatch.setattr(storage, "DB_PATH", tmp_path / "runs.sqlite")
+    monkeypatch.setattr(storage, "RUNS_DIR", runs_dir)
+    monkeypatch.setattr(storage, "RUNS_STREAM", runs_dir / "runs.jsonl.gz")
+    monkeypatch.setattr(storage, "_conn", None)
+
+    run = LLMRunResult("gpt-5o-mini", "prompt", "## Out", 10, 1, 2, 0.01)
+    bad = LLMComparisonResult("brief", run, run, {}, None, "t0", {})  # winner is NOT NULL
+    with pytest.raises(sqlite3.IntegrityError):
+        storage.save_results([_result("t1"), bad])
+    storage._conn.close()
+
+    assert not (runs_dir / "runs.jsonl.gz").exists()
@@ -0,0 +1,26 @@
+import json
+
+from src.quality_agent import plagiarism
+
+
+def test_plagiarism_score_tracks_corpus_changes(tmp_path):
+    text = "one two three four five six seven eight"
+    (tmp_path / "a.json").write_text(json.dumps({"content": text}), encoding="utf-8")
+    assert plagiarism.plagiarism_score(text, str(tmp_path)) == 100.0
+
+    # A fresh process (empty in-memory cache) reads the persisted index.
+    plagiarism._CORPUS_CACHE.clear()
+    assert (tmp_path / plagiarism.NGRAM_INDEX_NAME).exists()
+    assert plagiarism.plagiarism_score(text, str(tmp_path)) == 100.0
+
+    (tmp_path / "a.json").unlink()
+    assert plagiarism.plagiarism_score(text, str(tmp_path)) == 0.0
+
+
+def test_non_object_json_files_are_skipped(tmp_path):
+    text = "one two three four five six seven eight"
+    (tmp_path / "a.json").write_text(json.dumps({"content": text}), encoding="utf-8")
+    (tmp_path / "list.json").write_text(json.dumps(["not", "a", "draft"]), encoding="utf-8")
+    (tmp_path / "string.json").write_text(json.dumps("draft"), encoding="utf-8")
+    (tmp_path / "number.json").write_text("42", encoding="utf-8")
+    assert plagiarism.plagiarism_score(text, str(tmp_path)) == 100.0
@@ -0,0 +1,72 @@
+import os
+import stat
+
+import pytest
+
+from src.quality_agent import utils
+from src.quality_agent.utils import load_draft, save_json
+
+
+def test_save_json_writes_document_once(tmp_path, monkeypatch):
+    writes = []
+    real_tempfile = utils.tempfile.NamedTemporaryFile
+
+    def counting_tempfile(*args, **kwargs):
+        f = real_tempfile(*args, **kwargs)
+        real_write = f.write
+
+        def write(data):
+            writes.append(len(data))
+            return real_write(data)
+
+        f.write = write
+        return f
+
+    monkeypatch.setattr(utils.tempfile, "NamedTemporaryFile", counting_tempfile)
+    draft = {"title": "Café", "content": "body " * 500, "tags": ["a", "b"]}
+    out = tmp_path / "final" / "draft.json"
+    save_json(draft, out)
+    monkeypatch.undo()
+
+    assert len(writes) == 1
+    assert load_draft(out) == draft
+    assert [p.name for p in out.parent.iterdir()] == ["draft.json"]
+
+
+def test_save_json_failure_keeps_old_file_and_removes_temp(tmp_path, monkeypatch):
+    out = tmp_path / "draft.json"
+    save_json({"title": "first"}, out)
+
+    def failing_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(utils.os, "replace", failing_replace)
+    with pytest.raises(OSError):
+        save_json({"title": "second"}, out)
+    monkeypatch.undo()
+
+    assert load_draft(out) == {"title": "first"}
+    assert [p.name for p in tmp_path.iterdir()] == ["draft.json"]
+
+
+def test_load_draft_rereads_rewritten_file(tmp_path):
+    path = str(tmp_path / "draft.json")
+    save_json({"title": "first"}, path)
+    first = load_draft(path)
+    first["title"] = "mutated"
+    assert load_draft(path) == {"title": "first"}
+
+    save_json({"title": "second, longer"}, path)
+    assert load_draft(path) == {"title": "second, longer"}
+
+
+def test_save_json_uses_default_file_mode_and_keeps_existing_mode(tmp_path):
+    out = tmp_path / "draft.json"
+    save_json({"title": "first"}, out)
+    umask = os.umask(0)
+    os.umask(umask)
+    assert stat.S_IMODE(out.stat().st_mode) == 0o666 & ~umask
+
+    out.chmod(0o640)
+    save_json({"title": "second"}, out)
+    assert stat.S_IMODE(out.stat().st_mode) == 0o640
@@ -0,0 +1,47 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.content_brain.seo_optimizer import _scan, compute_seo_score
+
+
+def test_scan_counts_words_sections_links_and_keyword():
+    content = "## Intro\nWordPress tips ([docs](https://wordpress.com/support)).\n## Next\nwordpress"
+    words, sections, links, kw = _scan(content, "wordpress")
+    assert words == 10
+    assert sections == 2
+    assert links == 1
+    assert kw == 3
+
+
+def test_scan_treats_unclosed_link_like_findall():
+    # The first "(" runs to the first ")", swallowing the second link start.
+    content = "(http://a see [x](https://b.example) (https://c.example)"
+    assert _scan(content, None)[2] == 2
+
+
+def test_compute_seo_score_reports_missing_links():
+    draft = {"title": "Short", "keywords": ["ai"], "content": "ai ai ai"}
+    _, details = compute_seo_score(draft)
+    assert details["links"] == "missing"
+    assert details["primary_kw_in_body"] == 3
+
+
+def test_native_scan_matches_regex_scan():
+    pytest.importorskip("numba")
+    from src.content_brain import _seo_native
+    from src.content_brain.seo_optimizer import _scan_regex
+
+    content = "## Intro\r\n##\tTabbed\nAI [x](https://a.b/c) (http://) (https://q\n## WordPress wordpress"
+    for pk in (None, "wordpress", "ai"):
+        assert _seo_native.scan(content, pk) == _scan_regex(content, pk)
+
+
+def test_importing_optimizer_does_not_load_native_scanner():
+    code = (
+        "import sys; import src.content_brain.seo_optimizer; "
+        "sys.exit('src.content_brain._seo_native' in sys.modules or 'numba' in sys.modules)"
+    )
+    subprocess.run([sys.executable, "-c", code], cwd=Path(__file__).resolve().parents[1], check=True)